@@ -0,0 +1,227 @@
+STRATEGIES = ("linear", "binary", "interpolation", "exponential")
+
+
+def linear_search_probes(arr, x):
+    """Performs a linear search and counts the elements read.
+
+    Args:
+        arr (list): The list of elements to search through.
+        x (int): The element to search for.
+
+    Returns:
+        tuple: The index of x if found (otherwise -1) and the number of probes.
+    """
+    for i in range(len(arr)):
+        if arr[i] == x:
+            return i, i + 1
+    return -1, len(arr)
+
+
+def binary_search_probes(arr, x, low=0, high=None):
+    """Performs an iterative binary search and counts the elements read.
+
+    Args:
+        arr (list): The sorted list of elements to search through.
+        x (int): The element to search for.
+        low (int): The lower index of the subarray to search.
+        high (int): The upper index of the subarray to search, defaults to the last index.
+
+    Returns:
+        tuple: The index of x if found (otherwise -1) and the number of probes.
+    """
+    if high is None:
+        high = len(arr) - 1
+    probes = 0
+    while low <= high:
+        mid = (high + low) // 2
+        value = arr[mid]
+        probes += 1
+        if value == x:
+            return mid, probes
+        elif value > x:
+            high = mid - 1
+        else:
+            low = mid + 1
+    return -1, probes
+
+
+def interpolation_search(arr, x):
+    """Performs an interpolation search on a sorted list of numbers.
+
+    Each probe is placed where x would sit if the keys between the current
+    bounds were evenly spaced, which takes O(log log n) probes on uniformly
+    distributed keys.
+
+    Args:
+        arr (list): The sorted list of numbers to search through.
+        x (int): The element to search for.
+
+    Returns:
+        tuple: The index of x if found (otherwise -1) and the number of probes.
+    """
+    low, high = 0, len(arr) - 1
+    if high < 0:
+        return -1, 0
+    low_value, high_value = arr[low], arr[high]
+    probes = 2
+    while low <= high and low_value <= x <= high_value:
+        if high_value == low_value:
+            return (low, probes) if low_value == x else (-1, probes)
+
+        pos = low + int((x - low_value) * (high - low) / (high_value - low_value))
+        pos = min(max(pos, low), high)
+        value = arr[pos]
+        probes += 1
+        if value == x:
+            return pos, probes
+        elif value < x:
+            low = pos + 1
+            if low > high:
+                break
+            low_value = arr[low]
+            probes += 1
+        else:
+            high = pos - 1
+            if low > high:
+                break
+            high_value = arr[high]
+            probes += 1
+    return -1, probes
+
+
+def exponential_search(arr, x, hint=0):
+    """Performs a galloping search outward from a hint position.
+
+    The search doubles its step away from the hint until x is bracketed and
+    then binary searches the bracket, so a key d positions from the hint costs
+    O(log d) probes regardless of the array size.
+
+    Args:
+        arr (list): The sorted list of elements to search through.
+        x (int): The element to search for.
+        hint (int): The position to start from, e.g. the index of the last hit.
+
+    Returns:
+        tuple: The index of x if found (otherwise -1) and the number of probes.
+    """
+    n = len(arr)
+    if n == 0:
+        return -1, 0
+    hint = min(max(hint, 0), n - 1)
+    value = arr[hint]
+    probes = 1
+    if value == x:
+        return hint, probes
+
+    step = 1
+    if value < x:
+        # Gallop right until arr[bound] >= x or the end is reached
+        low = hint + 1
+        bound = hint + step
+        while bound < n:
+            value = arr[bound]
+            probes += 1
+            if value >= x:
+                break
+            low = bound + 1
+            step *= 2
+            bound = hint + step
+        high = min(bound, n - 1)
+    else:
+        # Gallop left until arr[bound] <= x or the start is reached
+        high = hint - 1
+        bound = hint - step
+        while bound >= 0:
+            value = arr[bound]
+            probes += 1
+            if value <= x:
+                break
+            high = bound - 1
+            step *= 2
+            bound = hint - step
+        low = max(bound, 0)
+
+    index, inner_probes = binary_search_probes(arr, x, low, high)
+    return index, probes + inner_probes
+
+
+def choose_strategy(arr, hint=None, sample_size=32, tolerance=0.05):
+    """Picks a search strategy by sampling the array.
+
+    Args:
+        arr (list): The sorted list of elements to search through.
+        hint (int): The index of the last hit, if the caller has one.
+        sample_size (int): The number of evenly spaced elements to sample;
+            at least the two endpoints are always sampled.
+        tolerance (float): The largest deviation from an evenly spaced layout,
+            as a fraction of the array length, that still counts as uniform.
+
+    Returns:
+        str: One of "linear", "binary", "interpolation" or "exponential".
+    """
+    n = len(arr)
+    if n <= 8:
+        return "linear"
+    if hint is not None:
+        return "exponential"
+
+    first, last = arr[0], arr[-1]
+    if not all(isinstance(v, (int, float)) for v in (first, last)) or first == last:
+        return "binary"
+
+    # Compare each sampled key with where an evenly spaced layout would put it
+    samples = min(max(sample_size, 2), n)
+    span = last - first
+    worst = 0.0
+    for k in range(samples):
+        i = k * (n - 1) // (samples - 1)
+        expected = (arr[i] - first) / span * (n - 1)
+        worst = max(worst, abs(expected - i))
+    return "interpolation" if worst <= tolerance * n else "binary"
+
+
+def search(arr, x, strategy="auto", hint=None):
+    """Searches a sorted list with a chosen or automatically selected strategy.
+
+    Args:
+        arr (list): The sorted list of elements to search through.
+        x (int): The element to search for.
+        strategy (str): "auto" or one of the names in STRATEGIES.
+        hint (int): The index of the last hit, used by the exponential strategy.
+
+    Returns:
+        tuple: The index of x if found (otherwise -1), the strategy used, and
+            the number of probes.
+
+    Raises:
+        ValueError: If the strategy is not recognised.
+    """
+    if strategy == "auto":
+        strategy = choose_strategy(arr, hint)
+
+    if strategy == "linear":
+        index, probes = linear_search_probes(arr, x)
+    elif strategy == "binary":
+        index, probes = binary_search_probes(arr, x)
+    elif strategy == "interpolation":
+        index, probes = interpolation_search(arr, x)
+    elif strategy == "exponential":
+        index, probes = exponential_search(arr, x, hint or 0)
+    else:
+        raise ValueError(f"Unknown search strategy: {strategy}")
+    return index, strategy, probes
+
+
+if __name__ == "__main__":
+    uniform = list(range(0, 200000, 2))
+    skewed = sorted(i * i for i in range(100000))
+
+    for name, arr, x, hint in [
+        ("Uniform keys", uniform, 123456, None),
+        ("Skewed keys", skewed, 9801 ** 2, None),
+        ("Near the last hit", uniform, 123470, 61728),
+        ("Absent key", uniform, 123457, None),
+    ]:
+        for strategy in ("auto", "binary"):
+            index, used, probes = search(arr, x, strategy, hint)
+            print(f"{name} ({strategy}): index {index} via {used} in {probes} probes")
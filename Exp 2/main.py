@@ -1,3 +1,11 @@
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; binary_search_many falls back to bisect
+    np = None
+
+
 def linear_search(arr, x):
     """Performs a linear search on the given list to find the element x.
 
@@ -26,16 +34,48 @@ def binary_search(arr, x, low, high):
     Returns:
         int: The index of x if found, otherwise -1.
     """
-    if low > high:
-        return -1
-    
-    mid = (high + low) // 2
-    if arr[mid] == x:
-        return mid
-    elif arr[mid] > x:
-        return binary_search(arr, x, low, mid - 1)
-    else:
-        return binary_search(arr, x, mid + 1, high)
+    # Iterative form of the divide step, so deep inputs cannot hit the recursion limit
+    while low <= high:
+        mid = (high + low) // 2
+        if arr[mid] == x:
+            return mid
+        elif arr[mid] > x:
+            high = mid - 1
+        else:
+            low = mid + 1
+    return -1
+
+
+def binary_search_many(arr, keys):
+    """Looks up a whole block of keys in the sorted list in one pass.
+
+    Uses a vectorized searchsorted when NumPy is available, and falls back to
+    bisect otherwise.
+
+    Args:
+        arr (list): The sorted list of elements to search through.
+        keys (list): The elements to search for.
+
+    Returns:
+        list: For every key, the index of its leftmost occurrence in arr, or -1
+            if the key is absent.
+    """
+    if np is not None:
+        sorted_arr = np.asarray(arr)
+        key_arr = np.asarray(keys)
+        if len(sorted_arr) == 0:
+            return [-1] * len(key_arr)
+        positions = np.searchsorted(sorted_arr, key_arr, side="left")
+        clipped = np.minimum(positions, len(sorted_arr) - 1)
+        found = (positions < len(sorted_arr)) & (sorted_arr[clipped] == key_arr)
+        return np.where(found, positions, -1).tolist()
+
+    n = len(arr)
+    indices = []
+    for x in keys:
+        pos = bisect_left(arr, x)
+        indices.append(pos if pos < n and arr[pos] == x else -1)
+    return indices
 
 
 def main():
@@ -53,6 +93,7 @@ def main():
     
     print(f"Index of {x} using linear search: {linear_search(arr, x)}")
     print(f"Index of {x} using binary search: {binary_search(arr, x, 0, len(arr) - 1)}")
+    print(f"Index of {x} using batched binary search: {binary_search_many(arr, [x])[0]}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,274 @@
+import argparse
+import csv
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+
+from main import binary_search, linear_search
+
+# Fixed-width record formats supported by the on-disk key files
+TYPECODES = {"int64": "q", "float64": "d"}
+# Number of keys covered by each fence entry
+FENCE_STRIDE = 4096
+# Suffix of the sidecar file holding a key file's fence index
+FENCE_SUFFIX = ".fences"
+
+
+def fence_path(path):
+    """Returns the path of the fence sidecar for a key file."""
+    return path + FENCE_SUFFIX
+
+
+def write_fences(path, fences, fence_stride, key_count):
+    """Writes a fence index sidecar next to a key file.
+
+    The sidecar holds the stride and key count as two int64 values, followed
+    by the fence keys in the key file's own format.
+
+    Args:
+        path (str): Path of the key file the fences describe.
+        fences (array): The first key of every block of fence_stride keys.
+        fence_stride (int): The number of keys covered by each fence entry.
+        key_count (int): The number of keys in the key file.
+    """
+    with open(fence_path(path), "wb") as file:
+        array("q", (fence_stride, key_count)).tofile(file)
+        fences.tofile(file)
+
+
+def read_fences(path, typecode, fence_stride, key_count):
+    """Loads a fence index sidecar if it matches the key file.
+
+    Args:
+        path (str): Path of the key file.
+        typecode (str): The array typecode of the keys.
+        fence_stride (int): The expected number of keys per fence entry.
+        key_count (int): The number of keys in the key file.
+
+    Returns:
+        array: The fence keys, or None if the sidecar is missing, was written
+            with another stride, or is older than or inconsistent with the
+            key file.
+    """
+    sidecar = fence_path(path)
+    try:
+        if os.path.getmtime(sidecar) < os.path.getmtime(path):
+            return None
+        with open(sidecar, "rb") as file:
+            header = array("q")
+            header.fromfile(file, 2)
+            fences = array(typecode)
+            fences.frombytes(file.read())
+    except (OSError, EOFError):
+        return None
+    expected = -(-key_count // fence_stride)
+    if tuple(header) != (fence_stride, key_count) or len(fences) != expected:
+        return None
+    return fences
+
+
+class SortedKeyFile:
+    """A sorted fixed-width binary key file searched in place through mmap.
+
+    The file is mapped read-only and exposed as a typed memoryview, so the
+    existing linear_search and binary_search run on it unchanged. A fence
+    index holding the first key of every block of ``fence_stride`` keys is
+    kept in memory; a lookup bisects the fences and then binary searches a
+    single block, touching only a few pages of the file.
+
+    The fence index is read from the sidecar written by convert_to_binary,
+    so opening a file does not touch the mapped keys. Without a valid
+    sidecar the fences are rebuilt by reading one key per fence_stride
+    keys, which faults in roughly one page per block (most of the file once
+    readahead kicks in); the result is saved as a sidecar when possible.
+    """
+
+    def __init__(self, path, dtype="int64", fence_stride=FENCE_STRIDE):
+        """Maps the key file and loads or builds the fence index.
+
+        Args:
+            path (str): Path to a file of native-endian int64 or float64 keys.
+            dtype (str): The key type, "int64" or "float64".
+            fence_stride (int): The number of keys covered by each fence entry.
+
+        Raises:
+            ValueError: If the dtype is unsupported, the stride is not positive
+                or the file size is not a multiple of the key width.
+        """
+        if dtype not in TYPECODES:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        if fence_stride <= 0:
+            raise ValueError("Fence stride must be positive.")
+        typecode = TYPECODES[dtype]
+        width = array(typecode).itemsize
+        size = os.path.getsize(path)
+        if size % width:
+            raise ValueError(f"File size {size} is not a multiple of {width} bytes.")
+
+        self.path = path
+        self.dtype = dtype
+        self.fence_stride = fence_stride
+        self._file = open(path, "rb")
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.keys = memoryview(self._mmap).cast(typecode)
+        else:
+            # mmap cannot map an empty file
+            self._mmap = None
+            self.keys = memoryview(b"").cast(typecode)
+        self.fences = read_fences(path, typecode, fence_stride, len(self.keys))
+        if self.fences is None:
+            self.fences = array(typecode, self.keys[::fence_stride])
+            try:
+                write_fences(path, self.fences, fence_stride, len(self.keys))
+            except OSError:
+                # A read-only location just means rebuilding on every open
+                pass
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Releases the memory map and the underlying file."""
+        self.keys.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def binary_search(self, x):
+        """Finds a key using the fence index and one in-block binary search.
+
+        Args:
+            x (int or float): The key to search for.
+
+        Returns:
+            int: The index of x in the file if found, otherwise -1.
+        """
+        block = bisect_right(self.fences, x) - 1
+        if block < 0:
+            return -1
+        low = block * self.fence_stride
+        high = min(low + self.fence_stride, len(self.keys)) - 1
+        return binary_search(self.keys, x, low, high)
+
+    def linear_search(self, x):
+        """Scans the mapped keys in order for x.
+
+        Args:
+            x (int or float): The key to search for.
+
+        Returns:
+            int: The index of x in the file if found, otherwise -1.
+        """
+        return linear_search(self.keys, x)
+
+
+def convert_to_binary(source, destination, dtype="int64", column=None,
+                      delimiter=",", skip_header=False, chunk_size=1 << 16,
+                      fence_stride=FENCE_STRIDE):
+    """Converts a text or CSV column of sorted numbers into a binary key file.
+
+    The fence index for SortedKeyFile is collected during the same pass and
+    written to a sidecar next to the destination.
+
+    Args:
+        source (str): Path to a text file with one number per line, or a CSV file.
+        destination (str): Path of the binary file to write.
+        dtype (str): The key type to write, "int64" or "float64".
+        column (int): The zero-based CSV column to read; None reads whole lines.
+        delimiter (str): The CSV field delimiter.
+        skip_header (bool): Whether to skip the first line of the source.
+        chunk_size (int): The number of keys buffered before each write.
+        fence_stride (int): The number of keys covered by each fence entry.
+
+    Returns:
+        int: The number of keys written.
+
+    Raises:
+        ValueError: If the dtype is unsupported, the stride is not positive
+            or the keys are not sorted.
+    """
+    if dtype not in TYPECODES:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    if fence_stride <= 0:
+        raise ValueError("Fence stride must be positive.")
+    typecode = TYPECODES[dtype]
+    parse = int if dtype == "int64" else float
+
+    count = 0
+    previous = None
+    buffer = array(typecode)
+    fences = array(typecode)
+    with open(source, newline="") as src, open(destination, "wb") as dst:
+        rows = csv.reader(src, delimiter=delimiter) if column is not None else src
+        if skip_header:
+            next(rows, None)
+        for row in rows:
+            field = row[column] if column is not None else row
+            if not field.strip():
+                continue
+            value = parse(field)
+            if previous is not None and value < previous:
+                raise ValueError(f"Keys must be sorted: {value} follows {previous}.")
+            previous = value
+            if (count + len(buffer)) % fence_stride == 0:
+                fences.append(value)
+            buffer.append(value)
+            if len(buffer) >= chunk_size:
+                buffer.tofile(dst)
+                count += len(buffer)
+                del buffer[:]
+        buffer.tofile(dst)
+        count += len(buffer)
+    # Written after the key file is closed, so the sidecar is never older than it
+    write_fences(destination, fences, fence_stride, count)
+    return count
+
+
+def main():
+    """Command-line entry point for converting and searching key files."""
+    parser = argparse.ArgumentParser(description="Search sorted binary key files via mmap.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert a text/CSV column to a key file")
+    convert.add_argument("source")
+    convert.add_argument("destination")
+    convert.add_argument("--dtype", choices=sorted(TYPECODES), default="int64")
+    convert.add_argument("--column", type=int, default=None)
+    convert.add_argument("--delimiter", default=",")
+    convert.add_argument("--skip-header", action="store_true")
+    convert.add_argument("--fence-stride", type=int, default=FENCE_STRIDE)
+
+    find = commands.add_parser("search", help="look up keys in a key file")
+    find.add_argument("path")
+    find.add_argument("keys", nargs="+")
+    find.add_argument("--dtype", choices=sorted(TYPECODES), default="int64")
+    find.add_argument("--fence-stride", type=int, default=FENCE_STRIDE)
+    find.add_argument("--linear", action="store_true", help="use linear search")
+
+    args = parser.parse_args()
+    if args.command == "convert":
+        count = convert_to_binary(args.source, args.destination, args.dtype,
+                                  args.column, args.delimiter, args.skip_header,
+                                  fence_stride=args.fence_stride)
+        print(f"Wrote {count} keys to {args.destination}")
+    else:
+        parse = int if args.dtype == "int64" else float
+        with SortedKeyFile(args.path, args.dtype, args.fence_stride) as key_file:
+            for key in map(parse, args.keys):
+                if args.linear:
+                    index = key_file.linear_search(key)
+                else:
+                    index = key_file.binary_search(key)
+                print(f"Index of {key}: {index}")
+
+
+if __name__ == "__main__":
+    main()
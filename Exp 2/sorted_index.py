@@ -0,0 +1,272 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedIndex:
+    """A persistent sorted index stored as a list of small sorted blocks.
+
+    Keys are kept in blocks of at most ``2 * block_size`` elements, together
+    with the maximum of each block and a Fenwick tree over the block lengths.
+    Locating a key is a binary search over the block maxima followed by one
+    inside the block, and positional queries use the Fenwick tree, so changes
+    between searches never require re-sorting the whole key set.
+    """
+
+    def __init__(self, values=(), block_size=512):
+        """Initializes the index and bulk loads the given values.
+
+        Args:
+            values (iterable): The initial keys, in any order.
+            block_size (int): The target number of keys per block.
+
+        Raises:
+            ValueError: If block_size is not positive.
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be positive.")
+        self.block_size = block_size
+        self.bulk_load(values)
+
+    def bulk_load(self, values):
+        """Replaces the contents of the index with the given values.
+
+        Args:
+            values (iterable): The keys to load, in any order.
+        """
+        keys = sorted(values)
+        size = self.block_size
+        self._blocks = [keys[i:i + size] for i in range(0, len(keys), size)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(keys)
+        self._rebuild_tree()
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, x):
+        return self.index(x) != -1
+
+    def __getitem__(self, position):
+        """Returns the key at the given position in sorted order."""
+        if position < 0:
+            position += self._len
+        if not 0 <= position < self._len:
+            raise IndexError("SortedIndex index out of range.")
+        block, offset = self._locate_position(position)
+        return self._blocks[block][offset]
+
+    def __repr__(self):
+        return f"SortedIndex({list(self)})"
+
+    def insert(self, x):
+        """Inserts a key, keeping the index sorted.
+
+        Args:
+            x (int): The key to insert.
+        """
+        if not self._blocks:
+            self._blocks.append([x])
+            self._maxes.append(x)
+            self._len = 1
+            self._rebuild_tree()
+            return
+
+        block = bisect_left(self._maxes, x)
+        if block == len(self._blocks):
+            # Larger than every key: append to the last block
+            block -= 1
+            self._blocks[block].append(x)
+            self._maxes[block] = x
+        else:
+            insort(self._blocks[block], x)
+        self._len += 1
+        self._tree_add(block, 1)
+
+        if len(self._blocks[block]) > 2 * self.block_size:
+            self._split(block)
+
+    def delete(self, x):
+        """Removes one occurrence of a key.
+
+        Args:
+            x (int): The key to remove.
+
+        Returns:
+            bool: True if the key was present and removed, otherwise False.
+        """
+        block = bisect_left(self._maxes, x)
+        if block == len(self._blocks):
+            return False
+        keys = self._blocks[block]
+        offset = bisect_left(keys, x)
+        if offset == len(keys) or keys[offset] != x:
+            return False
+
+        del keys[offset]
+        self._len -= 1
+        if not keys:
+            del self._blocks[block]
+            del self._maxes[block]
+            self._rebuild_tree()
+            return True
+
+        self._maxes[block] = keys[-1]
+        self._tree_add(block, -1)
+        if len(keys) < self.block_size // 2 and len(self._blocks) > 1:
+            self._merge(block)
+        return True
+
+    def index(self, x):
+        """Finds the position of a key in sorted order.
+
+        Args:
+            x (int): The key to search for.
+
+        Returns:
+            int: The position of the leftmost occurrence of x, otherwise -1.
+                For distinct keys this matches binary_search on the sorted list.
+        """
+        block = bisect_left(self._maxes, x)
+        if block == len(self._blocks):
+            return -1
+        keys = self._blocks[block]
+        offset = bisect_left(keys, x)
+        if keys[offset] != x:
+            return -1
+        return self._prefix(block) + offset
+
+    def rank(self, x):
+        """Counts the keys strictly smaller than x.
+
+        Args:
+            x (int): The key to rank.
+
+        Returns:
+            int: The number of keys less than x.
+        """
+        block = bisect_left(self._maxes, x)
+        if block == len(self._blocks):
+            return self._len
+        return self._prefix(block) + bisect_left(self._blocks[block], x)
+
+    def count_range(self, low, high):
+        """Counts the keys in the closed range [low, high].
+
+        Args:
+            low (int): The lower bound of the range.
+            high (int): The upper bound of the range.
+
+        Returns:
+            int: The number of keys k with low <= k <= high.
+        """
+        if low > high:
+            return 0
+        return self._rank_right(high) - self.rank(low)
+
+    def range(self, low, high):
+        """Lists the keys in the closed range [low, high] in sorted order.
+
+        Args:
+            low (int): The lower bound of the range.
+            high (int): The upper bound of the range.
+
+        Returns:
+            list: The keys k with low <= k <= high.
+        """
+        result = []
+        if low > high:
+            return result
+        block = bisect_left(self._maxes, low)
+        offset = bisect_left(self._blocks[block], low) if block < len(self._blocks) else 0
+        while block < len(self._blocks):
+            keys = self._blocks[block]
+            end = bisect_right(keys, high, offset)
+            result.extend(keys[offset:end])
+            if end < len(keys):
+                break
+            block += 1
+            offset = 0
+        return result
+
+    def _rank_right(self, x):
+        """Counts the keys less than or equal to x."""
+        block = bisect_right(self._maxes, x)
+        if block == len(self._blocks):
+            return self._len
+        return self._prefix(block) + bisect_right(self._blocks[block], x)
+
+    def _split(self, block):
+        """Splits an oversized block into two halves."""
+        keys = self._blocks[block]
+        half = len(keys) // 2
+        self._blocks[block:block + 1] = [keys[:half], keys[half:]]
+        self._maxes[block:block + 1] = [keys[half - 1], keys[-1]]
+        self._rebuild_tree()
+
+    def _merge(self, block):
+        """Merges an undersized block into a neighbour."""
+        if block == len(self._blocks) - 1:
+            block -= 1
+        merged = self._blocks[block] + self._blocks[block + 1]
+        self._blocks[block:block + 2] = [merged]
+        self._maxes[block:block + 2] = [merged[-1]]
+        if len(merged) > 2 * self.block_size:
+            self._split(block)
+        else:
+            self._rebuild_tree()
+
+    def _rebuild_tree(self):
+        """Rebuilds the Fenwick tree over block lengths in linear time."""
+        tree = [0] * (len(self._blocks) + 1)
+        for i, keys in enumerate(self._blocks, start=1):
+            tree[i] += len(keys)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, block, delta):
+        """Adds delta to the length recorded for one block."""
+        i = block + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block):
+        """Returns the number of keys stored in the blocks before the given one."""
+        total = 0
+        i = block
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate_position(self, position):
+        """Maps a sorted position to a (block, offset) pair via the Fenwick tree."""
+        block = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = block + step
+            if nxt < len(self._tree) and self._tree[nxt] <= position:
+                block = nxt
+                position -= self._tree[nxt]
+            step >>= 1
+        return block, position
+
+
+if __name__ == "__main__":
+    index = SortedIndex([42, 7, 19, 3, 88, 61, 25], block_size=2)
+    print(f"Loaded: {list(index)}")
+    print(f"Index of 25: {index.index(25)}")
+    index.insert(30)
+    index.insert(1)
+    print(f"After inserting 30 and 1: {list(index)}")
+    index.delete(42)
+    print(f"After deleting 42: {list(index)}")
+    print(f"Index of 30: {index.index(30)}")
+    print(f"Index of 42: {index.index(42)}")
+    print(f"Rank of 20: {index.rank(20)}")
+    print(f"Keys in [5, 60]: {index.range(5, 60)}")
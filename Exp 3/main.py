@@ -1,3 +1,6 @@
+import heapq
+import random
+
 
 class Employee:
     """Represents an employee with salary details."""
@@ -42,7 +45,7 @@ class Employee:
 
 
 class SalaryProcessor:
-    """Processes a list of employees to calculate minimum and maximum net salaries."""
+    """Processes a list of employees to calculate net salary statistics."""
 
     def __init__(self, employees):
         """Initializes the salary processor with a list of employees.
@@ -64,7 +67,7 @@ class SalaryProcessor:
         
         min_salary, max_salary = self._divide_and_conquer(self.employees)
         
-        if min_salary < 0 or max_salary < 0:
+        if self._has_negative(min_salary, max_salary):
             return ("Invalid input", "Invalid input")
         
         return min_salary, max_salary
@@ -99,6 +102,141 @@ class SalaryProcessor:
         
         return overall_min, overall_max
 
+    def lowest_salaries(self, k):
+        """Finds the k lowest net salaries without sorting the whole list.
+
+        Args:
+            k (int): The number of salaries to return.
+
+        Returns:
+            list or str: The k lowest net salaries in ascending order, None if
+                there are no employees, or a message if negative salaries are
+                detected.
+        """
+        net_salaries, message = self._net_salaries_or_message()
+        if net_salaries is None:
+            return message
+        return heapq.nsmallest(self._check_k(k, len(net_salaries)), net_salaries)
+
+    def highest_salaries(self, k):
+        """Finds the k highest net salaries without sorting the whole list.
+
+        Args:
+            k (int): The number of salaries to return.
+
+        Returns:
+            list or str: The k highest net salaries in descending order, None if
+                there are no employees, or a message if negative salaries are
+                detected.
+        """
+        net_salaries, message = self._net_salaries_or_message()
+        if net_salaries is None:
+            return message
+        return heapq.nlargest(self._check_k(k, len(net_salaries)), net_salaries)
+
+    def median_salary(self):
+        """Calculates the median net salary in linear time.
+
+        Returns:
+            float or str: The median net salary, None if there are no
+                employees, or a message if negative salaries are detected.
+        """
+        return self.percentile_salary(50)
+
+    def percentile_salary(self, percentile):
+        """Calculates a net salary percentile in linear time.
+
+        Values between two ranks are linearly interpolated, so the 50th
+        percentile of an even-sized payroll is the mean of the middle pair.
+
+        Args:
+            percentile (float): The percentile to compute, from 0 to 100.
+
+        Returns:
+            float or str: The net salary at the given percentile, None if there
+                are no employees, or a message if negative salaries are detected.
+
+        Raises:
+            ValueError: If the percentile is outside 0-100.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        net_salaries, message = self._net_salaries_or_message()
+        if net_salaries is None:
+            return message
+
+        rank = percentile / 100 * (len(net_salaries) - 1)
+        lower = int(rank)
+        lower_value = self._select(net_salaries, lower)
+        if lower == rank:
+            return lower_value
+        # After selection every later value is at least lower_value, so the
+        # next rank is the smallest of them
+        upper_value = min(net_salaries[lower + 1:])
+        return lower_value + (upper_value - lower_value) * (rank - lower)
+
+    def _net_salaries_or_message(self):
+        """Computes every net salary, applying the calculate_salaries checks.
+
+        Returns:
+            tuple: The net salaries and None, or None and the result the
+                queries report instead: None if there are no employees, or
+                "Invalid input" if any net salary is negative.
+        """
+        if not self.employees:
+            return None, None
+
+        net_salaries = [emp.calculate_net_salary() for emp in self.employees]
+
+        if self._has_negative(min(net_salaries), max(net_salaries)):
+            return None, "Invalid input"
+
+        return net_salaries, None
+
+    @staticmethod
+    def _has_negative(min_salary, max_salary):
+        """Checks the extreme net salaries for a negative value."""
+        return min_salary < 0 or max_salary < 0
+
+    @staticmethod
+    def _check_k(k, n):
+        """Validates the number of salaries requested by a top-k query."""
+        if not 0 < k <= n:
+            raise ValueError(f"k must be between 1 and the number of employees ({n}).")
+        return k
+
+    @staticmethod
+    def _select(values, k):
+        """Finds the k-th smallest value (0-based) by randomized quickselect.
+
+        The list is rearranged in place: each round partitions the remaining
+        range around a random pivot into smaller, equal and larger values and
+        writes them back, so afterwards values[:k] are at most the result and
+        values[k + 1:] at least it. The partitions are built with list
+        comprehensions, which is several times faster in CPython than
+        swapping elements one by one.
+
+        Args:
+            values (list): The values to select from; reordered in place.
+            k (int): The 0-based rank to select.
+
+        Returns:
+            float: The k-th smallest value.
+        """
+        left, right = 0, len(values)
+        while right - left > 1:
+            window = values[left:right]
+            pivot = random.choice(window)
+            lows = [v for v in window if v < pivot]
+            highs = [v for v in window if v > pivot]
+            values[left:right] = lows + [pivot] * (len(window) - len(lows) - len(highs)) + highs
+            if k < left + len(lows):
+                right = left + len(lows)
+            elif k >= right - len(highs):
+                left = right - len(highs)
+            else:
+                return pivot
+        return values[k]
 
 def run_test_case(employees, test_case_number):
     """Runs a test case and prints the minimum and maximum salaries.
@@ -114,98 +252,107 @@ def run_test_case(employees, test_case_number):
     print(f"Maximum Salary: {max_salary}")
 
 
-# Test Case 1: All Employees with Positive Salaries
-employees_test_1 = [
-    Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
-    Employee(basic_salary=3200, allowances=600, taxes=250, other_deductions=120),
-    Employee(basic_salary=2900, allowances=450, taxes=190, other_deductions=90),
-    Employee(basic_salary=3100, allowances=550, taxes=210, other_deductions=110),
-    Employee(basic_salary=3400, allowances=700, taxes=230, other_deductions=140),
-    Employee(basic_salary=3300, allowances=650, taxes=220, other_deductions=130),
-    Employee(basic_salary=2800, allowances=400, taxes=180, other_deductions=80),
-    Employee(basic_salary=3500, allowances=750, taxes=240, other_deductions=150),
-    Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
-    Employee(basic_salary=3100, allowances=550, taxes=210, other_deductions=110),
-]
-
-run_test_case(employees_test_1, 1)
-
-# Test Case 2: Varied Allowances and Deductions
-employees_test_2 = [
-    Employee(basic_salary=3500, allowances=1000, taxes=400, other_deductions=200),
-    Employee(basic_salary=2700, allowances=800, taxes=300, other_deductions=100),
-    Employee(basic_salary=4000, allowances=1200, taxes=500, other_deductions=250),
-    Employee(basic_salary=3200, allowances=900, taxes=350, other_deductions=150),
-    Employee(basic_salary=2800, allowances=850, taxes=320, other_deductions=130),
-    Employee(basic_salary=3600, allowances=1100, taxes=450, other_deductions=200),
-    Employee(basic_salary=3300, allowances=950, taxes=420, other_deductions=180),
-    Employee(basic_salary=3100, allowances=870, taxes=400, other_deductions=170),
-    Employee(basic_salary=3000, allowances=800, taxes=390, other_deductions=160),
-    Employee(basic_salary=3500, allowances=1000, taxes=420, other_deductions=210),
-]
-
-run_test_case(employees_test_2, 2)
-
-# Test Case 3: Employees with High Allowances and Deductions
-employees_test_3 = [
-    Employee(basic_salary=5000, allowances=2000, taxes=1000, other_deductions=500),
-    Employee(basic_salary=4000, allowances=1500, taxes=800, other_deductions=400),
-    Employee(basic_salary=4500, allowances=1800, taxes=900, other_deductions=450),
-    Employee(basic_salary=4700, allowances=1600, taxes=950, other_deductions=400),
-    Employee(basic_salary=4200, allowances=1400, taxes=850, other_deductions=300),
-    Employee(basic_salary=4600, allowances=1700, taxes=920, other_deductions=350),
-    Employee(basic_salary=4300, allowances=1550, taxes=870, other_deductions=320),
-    Employee(basic_salary=4400, allowances=1650, taxes=880, other_deductions=370),
-    Employee(basic_salary=4800, allowances=1900, taxes=960, other_deductions=410),
-    Employee(basic_salary=4900, allowances=2000, taxes=970, other_deductions=420),
-]
-
-run_test_case(employees_test_3, 3)
-
-# Test Case 4: All Negative Salaries
-employees_test_4 = [
-    Employee(basic_salary=-3000, allowances=-500, taxes=-200, other_deductions=-100),
-    Employee(basic_salary=-3200, allowances=-600, taxes=-250, other_deductions=-120),
-    Employee(basic_salary=-2900, allowances=-450, taxes=-190, other_deductions=-90),
-    Employee(basic_salary=-3100, allowances=-550, taxes=-210, other_deductions=-110),
-    Employee(basic_salary=-3400, allowances=-700, taxes=-230, other_deductions=-140),
-    Employee(basic_salary=-3300, allowances=-650, taxes=-220, other_deductions=-130),
-    Employee(basic_salary=-2800, allowances=-400, taxes=-180, other_deductions=-80),
-    Employee(basic_salary=-3500, allowances=-750, taxes=-240, other_deductions=-150),
-    Employee(basic_salary=-3000, allowances=-500, taxes=-200, other_deductions=-100),
-    Employee(basic_salary=-3100, allowances=-550, taxes=-210, other_deductions=-110),
-]
-
-run_test_case(employees_test_4, 4)
-
-# Test Case 5: Mixed Positive and Negative Values
-employees_test_5 = [
-    Employee(basic_salary=3000, allowances=500, taxes=-200, other_deductions=100),
-    Employee(basic_salary=-2500, allowances=400, taxes=150, other_deductions=-80),
-    Employee(basic_salary=5000, allowances=-1000, taxes=500, other_deductions=200),
-    Employee(basic_salary=4000, allowances=800, taxes=-400, other_deductions=150),
-    Employee(basic_salary=-4500, allowances=900, taxes=450, other_deductions=-180),
-    Employee(basic_salary=3000, allowances=-500, taxes=200, other_deductions=-100),
-    Employee(basic_salary=-3100, allowances=550, taxes=-210, other_deductions=110),
-    Employee(basic_salary=3300, allowances=-650, taxes=220, other_deductions=-130),
-    Employee(basic_salary=-2800, allowances=400, taxes=-180, other_deductions=80),
-    Employee(basic_salary=3500, allowances=-750, taxes=-240, other_deductions=150),
-]
-
-run_test_case(employees_test_5, 5)
-
-# Test Case 6: Zero and Negative Values
-employees_test_6 = [
-    Employee(basic_salary=0, allowances=0, taxes=0, other_deductions=0),
-    Employee(basic_salary=-1000, allowances=-200, taxes=-50, other_deductions=-20),
-    Employee(basic_salary=0, allowances=-100, taxes=-10, other_deductions=-5),
-    Employee(basic_salary=-2000, allowances=0, taxes=-100, other_deductions=-30),
-    Employee(basic_salary=500, allowances=0, taxes=0, other_deductions=-50),
-    Employee(basic_salary=-1500, allowances=-250, taxes=-70, other_deductions=-40),
-    Employee(basic_salary=0, allowances=-300, taxes=-20, other_deductions=0),
-    Employee(basic_salary=-2500, allowances=0, taxes=-200, other_deductions=-100),
-    Employee(basic_salary=1000, allowances=-500, taxes=-60, other_deductions=-30),
-    Employee(basic_salary=0, allowances=0, taxes=0, other_deductions=-10),
-]
-
-run_test_case(employees_test_6, 6)
\ No newline at end of file
+if __name__ == "__main__":
+    # Test Case 1: All Employees with Positive Salaries
+    employees_test_1 = [
+        Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
+        Employee(basic_salary=3200, allowances=600, taxes=250, other_deductions=120),
+        Employee(basic_salary=2900, allowances=450, taxes=190, other_deductions=90),
+        Employee(basic_salary=3100, allowances=550, taxes=210, other_deductions=110),
+        Employee(basic_salary=3400, allowances=700, taxes=230, other_deductions=140),
+        Employee(basic_salary=3300, allowances=650, taxes=220, other_deductions=130),
+        Employee(basic_salary=2800, allowances=400, taxes=180, other_deductions=80),
+        Employee(basic_salary=3500, allowances=750, taxes=240, other_deductions=150),
+        Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
+        Employee(basic_salary=3100, allowances=550, taxes=210, other_deductions=110),
+    ]
+
+    run_test_case(employees_test_1, 1)
+
+    # Test Case 2: Varied Allowances and Deductions
+    employees_test_2 = [
+        Employee(basic_salary=3500, allowances=1000, taxes=400, other_deductions=200),
+        Employee(basic_salary=2700, allowances=800, taxes=300, other_deductions=100),
+        Employee(basic_salary=4000, allowances=1200, taxes=500, other_deductions=250),
+        Employee(basic_salary=3200, allowances=900, taxes=350, other_deductions=150),
+        Employee(basic_salary=2800, allowances=850, taxes=320, other_deductions=130),
+        Employee(basic_salary=3600, allowances=1100, taxes=450, other_deductions=200),
+        Employee(basic_salary=3300, allowances=950, taxes=420, other_deductions=180),
+        Employee(basic_salary=3100, allowances=870, taxes=400, other_deductions=170),
+        Employee(basic_salary=3000, allowances=800, taxes=390, other_deductions=160),
+        Employee(basic_salary=3500, allowances=1000, taxes=420, other_deductions=210),
+    ]
+
+    run_test_case(employees_test_2, 2)
+
+    # Test Case 3: Employees with High Allowances and Deductions
+    employees_test_3 = [
+        Employee(basic_salary=5000, allowances=2000, taxes=1000, other_deductions=500),
+        Employee(basic_salary=4000, allowances=1500, taxes=800, other_deductions=400),
+        Employee(basic_salary=4500, allowances=1800, taxes=900, other_deductions=450),
+        Employee(basic_salary=4700, allowances=1600, taxes=950, other_deductions=400),
+        Employee(basic_salary=4200, allowances=1400, taxes=850, other_deductions=300),
+        Employee(basic_salary=4600, allowances=1700, taxes=920, other_deductions=350),
+        Employee(basic_salary=4300, allowances=1550, taxes=870, other_deductions=320),
+        Employee(basic_salary=4400, allowances=1650, taxes=880, other_deductions=370),
+        Employee(basic_salary=4800, allowances=1900, taxes=960, other_deductions=410),
+        Employee(basic_salary=4900, allowances=2000, taxes=970, other_deductions=420),
+    ]
+
+    run_test_case(employees_test_3, 3)
+
+    # Test Case 4: All Negative Salaries
+    employees_test_4 = [
+        Employee(basic_salary=-3000, allowances=-500, taxes=-200, other_deductions=-100),
+        Employee(basic_salary=-3200, allowances=-600, taxes=-250, other_deductions=-120),
+        Employee(basic_salary=-2900, allowances=-450, taxes=-190, other_deductions=-90),
+        Employee(basic_salary=-3100, allowances=-550, taxes=-210, other_deductions=-110),
+        Employee(basic_salary=-3400, allowances=-700, taxes=-230, other_deductions=-140),
+        Employee(basic_salary=-3300, allowances=-650, taxes=-220, other_deductions=-130),
+        Employee(basic_salary=-2800, allowances=-400, taxes=-180, other_deductions=-80),
+        Employee(basic_salary=-3500, allowances=-750, taxes=-240, other_deductions=-150),
+        Employee(basic_salary=-3000, allowances=-500, taxes=-200, other_deductions=-100),
+        Employee(basic_salary=-3100, allowances=-550, taxes=-210, other_deductions=-110),
+    ]
+
+    run_test_case(employees_test_4, 4)
+
+    # Test Case 5: Mixed Positive and Negative Values
+    employees_test_5 = [
+        Employee(basic_salary=3000, allowances=500, taxes=-200, other_deductions=100),
+        Employee(basic_salary=-2500, allowances=400, taxes=150, other_deductions=-80),
+        Employee(basic_salary=5000, allowances=-1000, taxes=500, other_deductions=200),
+        Employee(basic_salary=4000, allowances=800, taxes=-400, other_deductions=150),
+        Employee(basic_salary=-4500, allowances=900, taxes=450, other_deductions=-180),
+        Employee(basic_salary=3000, allowances=-500, taxes=200, other_deductions=-100),
+        Employee(basic_salary=-3100, allowances=550, taxes=-210, other_deductions=110),
+        Employee(basic_salary=3300, allowances=-650, taxes=220, other_deductions=-130),
+        Employee(basic_salary=-2800, allowances=400, taxes=-180, other_deductions=80),
+        Employee(basic_salary=3500, allowances=-750, taxes=-240, other_deductions=150),
+    ]
+
+    run_test_case(employees_test_5, 5)
+
+    # Test Case 6: Zero and Negative Values
+    employees_test_6 = [
+        Employee(basic_salary=0, allowances=0, taxes=0, other_deductions=0),
+        Employee(basic_salary=-1000, allowances=-200, taxes=-50, other_deductions=-20),
+        Employee(basic_salary=0, allowances=-100, taxes=-10, other_deductions=-5),
+        Employee(basic_salary=-2000, allowances=0, taxes=-100, other_deductions=-30),
+        Employee(basic_salary=500, allowances=0, taxes=0, other_deductions=-50),
+        Employee(basic_salary=-1500, allowances=-250, taxes=-70, other_deductions=-40),
+        Employee(basic_salary=0, allowances=-300, taxes=-20, other_deductions=0),
+        Employee(basic_salary=-2500, allowances=0, taxes=-200, other_deductions=-100),
+        Employee(basic_salary=1000, allowances=-500, taxes=-60, other_deductions=-30),
+        Employee(basic_salary=0, allowances=0, taxes=0, other_deductions=-10),
+    ]
+
+    run_test_case(employees_test_6, 6)
+
+    # Selection queries on the positive test case
+    processor = SalaryProcessor(employees_test_1)
+    print("Selection Queries:")
+    print(f"Lowest 3 Salaries: {processor.lowest_salaries(3)}")
+    print(f"Highest 3 Salaries: {processor.highest_salaries(3)}")
+    print(f"Median Salary: {processor.median_salary()}")
+    print(f"90th Percentile Salary: {processor.percentile_salary(90)}")
@@ -0,0 +1,148 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from payroll_columns import COLUMNS, PayrollColumns, np, pairwise_min_max
+
+# Below this many employees the process start-up cost outweighs any speedup
+SERIAL_CUTOFF = 200000
+
+
+def _partition_min_max(shm_name, n, start, end):
+    """Finds the net salary extremes of rows start..end-1 in shared memory.
+
+    Args:
+        shm_name (str): Name of the shared block holding the COLUMNS back to back.
+        n (int): The total number of rows in each column.
+        start (int): The first row of the partition.
+        end (int): One past the last row of the partition.
+
+    Returns:
+        tuple: The minimum and maximum net salaries and their global row indices.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        if np is not None:
+            basic, allowances, taxes, other = (
+                np.frombuffer(shm.buf, dtype=np.float64, count=end - start,
+                              offset=8 * (c * n + start))
+                for c in range(len(COLUMNS)))
+            net = basic + allowances - taxes - other
+            del basic, allowances, taxes, other
+            min_index, max_index = int(net.argmin()), int(net.argmax())
+            result = float(net[min_index]), float(net[max_index]), min_index, max_index
+        else:
+            view = shm.buf.cast("d")
+            columns = [view[c * n + start:c * n + end] for c in range(len(COLUMNS))]
+            net = array("d", (basic + allowance - tax - other for basic, allowance, tax, other
+                              in zip(*columns)))
+            for column in columns:
+                column.release()
+            view.release()
+            result = pairwise_min_max(net)
+    finally:
+        shm.close()
+
+    min_salary, max_salary, min_index, max_index = result
+    return min_salary, max_salary, min_index + start, max_index + start
+
+
+def _combine(left, right):
+    """Combines two partition results with the divide-and-conquer min/max merge."""
+    left_min, left_max, left_min_index, left_max_index = left
+    right_min, right_max, right_min_index, right_max_index = right
+    if right_min < left_min:
+        left_min, left_min_index = right_min, right_min_index
+    if right_max > left_max:
+        left_max, left_max_index = right_max, right_max_index
+    return left_min, left_max, left_min_index, left_max_index
+
+
+def parallel_min_max(payroll, workers=None, serial_cutoff=SERIAL_CUTOFF):
+    """Finds the extreme net salaries using a pool of worker processes.
+
+    The columns are copied once into a shared-memory block; each worker
+    attaches to it by name and handles one contiguous partition, so no
+    payroll data is pickled. Partition results are then merged pairwise.
+
+    Args:
+        payroll (PayrollColumns or list of Employee): The payroll to process.
+        workers (int): The number of worker processes, defaults to the CPU count.
+        serial_cutoff (int): Payrolls smaller than this are processed serially.
+
+    Returns:
+        tuple: The minimum net salary, the maximum net salary, and their
+            indices, or four Nones if the payroll is empty.
+    """
+    if not isinstance(payroll, PayrollColumns):
+        payroll = PayrollColumns.from_employees(payroll)
+    n = len(payroll)
+    workers = workers or os.cpu_count() or 1
+    if n < max(serial_cutoff, 1) or workers == 1:
+        return payroll.min_max()
+
+    shm = shared_memory.SharedMemory(create=True, size=8 * len(COLUMNS) * n)
+    try:
+        view = shm.buf.cast("d")
+        for c, column in enumerate(payroll.columns()):
+            view[c * n:(c + 1) * n] = memoryview(column)
+        view.release()
+
+        bounds = [n * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_partition_min_max, shm.name, n, bounds[k], bounds[k + 1])
+                       for k in range(workers) if bounds[k] < bounds[k + 1]]
+            results = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Combine neighbouring partitions pairwise, like the recursive combine step
+    while len(results) > 1:
+        merged = [_combine(results[i], results[i + 1]) for i in range(0, len(results) - 1, 2)]
+        if len(results) % 2:
+            merged.append(results[-1])
+        results = merged
+    return results[0]
+
+
+def calculate_salaries_parallel(payroll, workers=None, serial_cutoff=SERIAL_CUTOFF):
+    """Calculates the minimum and maximum net salaries in parallel.
+
+    Args:
+        payroll (PayrollColumns or list of Employee): The payroll to process.
+        workers (int): The number of worker processes, defaults to the CPU count.
+        serial_cutoff (int): Payrolls smaller than this are processed serially.
+
+    Returns:
+        tuple: A tuple containing the minimum and maximum net salaries or
+            a message if negative salaries are detected, matching
+            SalaryProcessor.calculate_salaries.
+    """
+    min_salary, max_salary, _, _ = parallel_min_max(payroll, workers, serial_cutoff)
+    if min_salary is None:
+        return None, None
+
+    if min_salary < 0 or max_salary < 0:
+        return ("Invalid input", "Invalid input")
+
+    return min_salary, max_salary
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rows = 2000000
+    payroll = PayrollColumns(
+        (random.uniform(2000, 6000) for _ in range(rows)),
+        (random.uniform(0, 2000) for _ in range(rows)),
+        (random.uniform(0, 1000) for _ in range(rows)),
+        (random.uniform(0, 500) for _ in range(rows)),
+    )
+    for worker_count in (1, os.cpu_count() or 1):
+        started = time.perf_counter()
+        result = parallel_min_max(payroll, workers=worker_count)
+        elapsed = time.perf_counter() - started
+        print(f"{worker_count} worker(s): {result} in {elapsed:.2f}s")
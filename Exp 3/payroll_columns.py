@@ -0,0 +1,196 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path uses pairwise min/max
+    np = None
+
+# Column order shared by every columnar payroll store
+COLUMNS = ("basic_salary", "allowances", "taxes", "other_deductions")
+
+
+def pairwise_min_max(values):
+    """Finds the minimum and maximum with about 3n/2 comparisons.
+
+    Elements are taken in pairs; the smaller of each pair is only compared
+    against the running minimum and the larger against the running maximum.
+
+    Args:
+        values (sequence): A non-empty indexable sequence of numbers.
+
+    Returns:
+        tuple: The minimum value, the maximum value, and the index of the
+            first occurrence of each.
+    """
+    n = len(values)
+    if n % 2:
+        min_value = max_value = values[0]
+        min_index = max_index = 0
+        start = 1
+    else:
+        if values[1] < values[0]:
+            min_value, max_value, min_index, max_index = values[1], values[0], 1, 0
+        elif values[1] > values[0]:
+            min_value, max_value, min_index, max_index = values[0], values[1], 0, 1
+        else:
+            min_value = max_value = values[0]
+            min_index = max_index = 0
+        start = 2
+
+    for i in range(start, n - 1, 2):
+        first, second = values[i], values[i + 1]
+        # Ties keep the earlier index, matching NumPy's argmin/argmax
+        if second < first:
+            small, small_index, large, large_index = second, i + 1, first, i
+        elif second > first:
+            small, small_index, large, large_index = first, i, second, i + 1
+        else:
+            small = large = first
+            small_index = large_index = i
+        if small < min_value:
+            min_value, min_index = small, small_index
+        if large > max_value:
+            max_value, max_index = large, large_index
+    return min_value, max_value, min_index, max_index
+
+
+class PayrollColumns:
+    """Stores payroll records as contiguous typed columns instead of Employee objects.
+
+    Each salary component is kept in its own ``array('d')`` column, so a row
+    costs 32 bytes and net salaries are computed column-wise (vectorized when
+    NumPy is available) without any per-object method calls.
+    """
+
+    def __init__(self, basic_salary=(), allowances=(), taxes=(), other_deductions=()):
+        """Initializes the store from four equally long columns.
+
+        Args:
+            basic_salary (iterable of float): The basic salary of each employee.
+            allowances (iterable of float): The allowances of each employee.
+            taxes (iterable of float): The taxes applicable to each employee.
+            other_deductions (iterable of float): Any other deductions per employee.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self.basic_salary = array("d", basic_salary)
+        self.allowances = array("d", allowances)
+        self.taxes = array("d", taxes)
+        self.other_deductions = array("d", other_deductions)
+        if len({len(column) for column in self.columns()}) > 1:
+            raise ValueError("All payroll columns must have the same length.")
+
+    @classmethod
+    def from_employees(cls, employees):
+        """Builds a columnar store from a list of Employee objects.
+
+        Args:
+            employees (list of Employee): The employees to convert.
+
+        Returns:
+            PayrollColumns: The columnar store.
+        """
+        return cls(*([getattr(emp, name) for emp in employees] for name in COLUMNS))
+
+    def __len__(self):
+        return len(self.basic_salary)
+
+    def columns(self):
+        """Returns the four salary columns in COLUMNS order."""
+        return self.basic_salary, self.allowances, self.taxes, self.other_deductions
+
+    def append(self, basic_salary, allowances, taxes, other_deductions):
+        """Appends a single payroll record.
+
+        Args:
+            basic_salary (float): The basic salary of the employee.
+            allowances (float): The allowances of the employee.
+            taxes (float): The taxes applicable to the employee.
+            other_deductions (float): Any other deductions from the employee's salary.
+        """
+        self.basic_salary.append(basic_salary)
+        self.allowances.append(allowances)
+        self.taxes.append(taxes)
+        self.other_deductions.append(other_deductions)
+
+    def gross_salaries(self):
+        """Calculates the gross salary of every employee.
+
+        Returns:
+            numpy.ndarray or array: Basic salary plus allowances, per employee.
+        """
+        if np is not None:
+            return self._view(self.basic_salary) + self._view(self.allowances)
+        return array("d", map(float.__add__, self.basic_salary, self.allowances))
+
+    def net_salaries(self):
+        """Calculates the net salary of every employee.
+
+        Returns:
+            numpy.ndarray or array: Gross salary minus taxes and other deductions.
+        """
+        if np is not None:
+            net = self._view(self.basic_salary) + self._view(self.allowances)
+            net -= self._view(self.taxes)
+            net -= self._view(self.other_deductions)
+            return net
+        return array("d", (basic + allowance - tax - other for basic, allowance, tax, other
+                           in zip(*self.columns())))
+
+    def min_max(self):
+        """Finds the extreme net salaries and the employees that hold them.
+
+        Returns:
+            tuple: The minimum net salary, the maximum net salary, the index of
+                the minimum (argmin) and the index of the maximum (argmax), or
+                four Nones if the store is empty.
+        """
+        if not len(self):
+            return None, None, None, None
+        net = self.net_salaries()
+        if np is not None:
+            min_index, max_index = int(net.argmin()), int(net.argmax())
+            return float(net[min_index]), float(net[max_index]), min_index, max_index
+        return pairwise_min_max(net)
+
+    def calculate_salaries(self):
+        """Calculates the minimum and maximum net salaries.
+
+        Returns:
+            tuple: A tuple containing the minimum and maximum net salaries or
+                a message if negative salaries are detected, matching
+                SalaryProcessor.calculate_salaries.
+        """
+        min_salary, max_salary, _, _ = self.min_max()
+        if min_salary is None:
+            return None, None
+
+        if min_salary < 0 or max_salary < 0:
+            return ("Invalid input", "Invalid input")
+
+        return min_salary, max_salary
+
+    @staticmethod
+    def _view(column):
+        """Wraps a column in a zero-copy NumPy view."""
+        return np.frombuffer(column, dtype=np.float64)
+
+
+if __name__ == "__main__":
+    from main import Employee, SalaryProcessor
+
+    employees = [
+        Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
+        Employee(basic_salary=3200, allowances=600, taxes=250, other_deductions=120),
+        Employee(basic_salary=2900, allowances=450, taxes=190, other_deductions=90),
+        Employee(basic_salary=3500, allowances=750, taxes=240, other_deductions=150),
+        Employee(basic_salary=2800, allowances=400, taxes=180, other_deductions=80),
+    ]
+    payroll = PayrollColumns.from_employees(employees)
+    min_salary, max_salary, min_index, max_index = payroll.min_max()
+    print(f"Columnar: min {min_salary} (employee {min_index}), max {max_salary} (employee {max_index})")
+    print(f"SalaryProcessor: {SalaryProcessor(employees).calculate_salaries()}")
+
+    payroll.append(-100, 0, 0, 0)
+    print(f"With a negative salary: {payroll.calculate_salaries()}")
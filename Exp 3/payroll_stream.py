@@ -0,0 +1,212 @@
+import csv
+import sys
+from array import array
+
+from payroll_columns import COLUMNS, PayrollColumns, np, pairwise_min_max
+
+# Binary records hold the four COLUMNS as consecutive native float64 values
+RECORD_WIDTH = len(COLUMNS)
+
+
+class PayrollSummary:
+    """Running gross/net salary statistics that can be merged across chunks."""
+
+    def __init__(self):
+        """Initializes an empty summary."""
+        self.count = 0
+        self.negative_count = 0
+        self.total_gross = 0.0
+        self.total_net = 0.0
+        self.min_salary = None
+        self.max_salary = None
+
+    def update(self, payroll):
+        """Folds one chunk of payroll records into the summary.
+
+        Args:
+            payroll (PayrollColumns): The chunk to add.
+        """
+        if not len(payroll):
+            return
+        net = payroll.net_salaries()
+        chunk = PayrollSummary()
+        chunk.count = len(payroll)
+        if np is not None:
+            chunk.total_gross = float(payroll.gross_salaries().sum())
+            chunk.total_net = float(net.sum())
+            chunk.negative_count = int((net < 0).sum())
+            chunk.min_salary, chunk.max_salary = float(net.min()), float(net.max())
+        else:
+            chunk.total_gross = float(sum(payroll.gross_salaries()))
+            chunk.total_net = float(sum(net))
+            chunk.negative_count = sum(1 for salary in net if salary < 0)
+            chunk.min_salary, chunk.max_salary, _, _ = pairwise_min_max(net)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combines another summary into this one, like the min/max combine step.
+
+        Args:
+            other (PayrollSummary): The summary to merge in.
+
+        Returns:
+            PayrollSummary: This summary, for chaining.
+        """
+        if other.count:
+            if self.count:
+                self.min_salary = min(self.min_salary, other.min_salary)
+                self.max_salary = max(self.max_salary, other.max_salary)
+            else:
+                self.min_salary, self.max_salary = other.min_salary, other.max_salary
+            self.count += other.count
+            self.negative_count += other.negative_count
+            self.total_gross += other.total_gross
+            self.total_net += other.total_net
+        return self
+
+    def calculate_salaries(self):
+        """Returns the minimum and maximum net salaries seen so far.
+
+        Returns:
+            tuple: A tuple containing the minimum and maximum net salaries or
+                a message if negative salaries are detected, matching
+                SalaryProcessor.calculate_salaries.
+        """
+        if not self.count:
+            return None, None
+
+        if self.negative_count:
+            return ("Invalid input", "Invalid input")
+
+        return self.min_salary, self.max_salary
+
+    def __str__(self):
+        average = self.total_net / self.count if self.count else None
+        return (f"Employees: {self.count}, Negative Salaries: {self.negative_count}, "
+                f"Total Gross: {self.total_gross}, Total Net: {self.total_net}, "
+                f"Average Net: {average}, Minimum Net: {self.min_salary}, "
+                f"Maximum Net: {self.max_salary}")
+
+
+def read_csv_chunks(path, chunk_size=100000, delimiter=","):
+    """Reads payroll records from a CSV file in fixed-size chunks.
+
+    The file must have a header naming the COLUMNS; any other columns are ignored.
+
+    Args:
+        path (str): Path to the CSV file.
+        chunk_size (int): The maximum number of records per chunk.
+        delimiter (str): The CSV field delimiter.
+
+    Yields:
+        PayrollColumns: The next chunk of records.
+
+    Raises:
+        ValueError: If the header is missing one of the salary columns.
+    """
+    with open(path, newline="") as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [name.strip() for name in header]
+        missing = [name for name in COLUMNS if name not in header]
+        if missing:
+            raise ValueError(f"CSV header is missing columns: {', '.join(missing)}")
+        positions = [header.index(name) for name in COLUMNS]
+
+        chunk = PayrollColumns()
+        for row in reader:
+            if not row:
+                continue
+            chunk.append(*(float(row[i]) for i in positions))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = PayrollColumns()
+        if len(chunk):
+            yield chunk
+
+
+def read_binary_chunks(path, chunk_size=100000):
+    """Reads payroll records from a binary file in fixed-size chunks.
+
+    Args:
+        path (str): Path to a file of native float64 records laid out as COLUMNS.
+        chunk_size (int): The maximum number of records per chunk.
+
+    Yields:
+        PayrollColumns: The next chunk of records.
+
+    Raises:
+        ValueError: If the file ends with a partial record.
+    """
+    with open(path, "rb") as file:
+        while True:
+            values = array("d")
+            try:
+                values.fromfile(file, chunk_size * RECORD_WIDTH)
+            except EOFError:
+                # fromfile keeps the values it managed to read before the end
+                pass
+            if not values:
+                return
+            if len(values) % RECORD_WIDTH:
+                raise ValueError("Binary payroll file ends with a partial record.")
+            yield PayrollColumns(*(values[i::RECORD_WIDTH] for i in range(RECORD_WIDTH)))
+
+
+def write_binary_records(path, chunks):
+    """Writes payroll chunks to the binary record format read by read_binary_chunks.
+
+    Args:
+        path (str): Path of the binary file to write.
+        chunks (iterable of PayrollColumns): The records to write.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            values = array("d", bytes(8 * RECORD_WIDTH * len(chunk)))
+            for i, column in enumerate(chunk.columns()):
+                values[i::RECORD_WIDTH] = column
+            values.tofile(file)
+            count += len(chunk)
+    return count
+
+
+def summarize_file(path, chunk_size=100000, file_format=None):
+    """Streams a payroll file chunk by chunk and summarizes it in bounded memory.
+
+    Args:
+        path (str): Path to a CSV or binary payroll file.
+        chunk_size (int): The maximum number of records held in memory at once.
+        file_format (str): "csv" or "binary"; inferred from the extension if None.
+
+    Returns:
+        PayrollSummary: The merged statistics for the whole file.
+    """
+    if file_format is None:
+        file_format = "csv" if path.lower().endswith(".csv") else "binary"
+    if file_format == "csv":
+        chunks = read_csv_chunks(path, chunk_size)
+    else:
+        chunks = read_binary_chunks(path, chunk_size)
+
+    summary = PayrollSummary()
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python payroll_stream.py <payroll.csv|payroll.bin> [chunk_size]")
+        sys.exit(1)
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    result = summarize_file(sys.argv[1], size)
+    min_salary, max_salary = result.calculate_salaries()
+    print(result)
+    print(f"Minimum Salary: {min_salary}")
+    print(f"Maximum Salary: {max_salary}")
@@ -0,0 +1,151 @@
+from payroll_columns import COLUMNS
+
+
+class SalaryIndex:
+    """A segment tree over net salaries that keeps min/max current after edits.
+
+    Every internal node stores the result of the divide-and-conquer combine
+    step (the min and max of its two halves), so after one employee changes
+    only the O(log n) nodes above it are recombined instead of re-running
+    the whole divide and conquer.
+    """
+
+    def __init__(self, employees):
+        """Initializes the index over a list of employees.
+
+        Args:
+            employees (list of Employee): A list of Employee objects.
+        """
+        self.build(employees)
+
+    def build(self, employees):
+        """Rebuilds the whole tree in O(n) from a list of employees.
+
+        Args:
+            employees (list of Employee): A list of Employee objects.
+        """
+        self.employees = employees
+        self.size = len(employees)
+        self._mins = [0] * (2 * self.size)
+        self._maxs = [0] * (2 * self.size)
+        for i, emp in enumerate(employees):
+            net_salary = emp.calculate_net_salary()
+            self._mins[self.size + i] = net_salary
+            self._maxs[self.size + i] = net_salary
+        for node in range(self.size - 1, 0, -1):
+            self._combine(node)
+
+    def __len__(self):
+        return self.size
+
+    def update(self, index, employee=None, **fields):
+        """Replaces or edits one employee and refreshes the affected nodes.
+
+        Args:
+            index (int): The position of the employee in the list.
+            employee (Employee): A replacement Employee, if given.
+            **fields: Salary attributes to change on the employee in place,
+                e.g. taxes=250 or allowances=600.
+
+        Raises:
+            IndexError: If the index is out of range.
+            AttributeError: If a field is not an Employee salary attribute.
+                Nothing is changed in that case.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("Employee index out of range.")
+        for name in fields:
+            if name not in COLUMNS:
+                raise AttributeError(f"'{name}' is not an Employee salary attribute")
+
+        if employee is not None:
+            self.employees[index] = employee
+        emp = self.employees[index]
+        for name, value in fields.items():
+            setattr(emp, name, value)
+
+        node = self.size + index
+        net_salary = emp.calculate_net_salary()
+        self._mins[node] = net_salary
+        self._maxs[node] = net_salary
+        node //= 2
+        while node:
+            self._combine(node)
+            node //= 2
+
+    def range_min_max(self, low, high):
+        """Finds the minimum and maximum net salaries for employees low..high.
+
+        Args:
+            low (int): The first employee index of the range.
+            high (int): The last employee index of the range, inclusive.
+
+        Returns:
+            tuple: The minimum and maximum net salaries in the range.
+
+        Raises:
+            IndexError: If the range is empty or out of bounds.
+        """
+        if not 0 <= low <= high < self.size:
+            raise IndexError("Employee index range out of bounds.")
+        left, right = low + self.size, high + self.size + 1
+        overall_min = overall_max = None
+        while left < right:
+            if left & 1:
+                overall_min, overall_max = self._merge(overall_min, overall_max, left)
+                left += 1
+            if right & 1:
+                right -= 1
+                overall_min, overall_max = self._merge(overall_min, overall_max, right)
+            left //= 2
+            right //= 2
+        return overall_min, overall_max
+
+    def calculate_salaries(self):
+        """Returns the current minimum and maximum net salaries.
+
+        Returns:
+            tuple: A tuple containing the minimum and maximum net salaries or
+                a message if negative salaries are detected, matching
+                SalaryProcessor.calculate_salaries.
+        """
+        if not self.size:
+            return None, None
+
+        min_salary, max_salary = self.range_min_max(0, self.size - 1)
+
+        if min_salary < 0 or max_salary < 0:
+            return ("Invalid input", "Invalid input")
+
+        return min_salary, max_salary
+
+    def _combine(self, node):
+        """Recomputes one internal node from its two children."""
+        left, right = 2 * node, 2 * node + 1
+        self._mins[node] = min(self._mins[left], self._mins[right])
+        self._maxs[node] = max(self._maxs[left], self._maxs[right])
+
+    def _merge(self, current_min, current_max, node):
+        """Folds one tree node into a running (min, max) pair."""
+        if current_min is None:
+            return self._mins[node], self._maxs[node]
+        return min(current_min, self._mins[node]), max(current_max, self._maxs[node])
+
+
+if __name__ == "__main__":
+    from main import Employee
+
+    employees = [
+        Employee(basic_salary=3000, allowances=500, taxes=200, other_deductions=100),
+        Employee(basic_salary=3200, allowances=600, taxes=250, other_deductions=120),
+        Employee(basic_salary=2900, allowances=450, taxes=190, other_deductions=90),
+        Employee(basic_salary=3100, allowances=550, taxes=210, other_deductions=110),
+        Employee(basic_salary=3400, allowances=700, taxes=230, other_deductions=140),
+    ]
+    index = SalaryIndex(employees)
+    print(f"Initial: {index.calculate_salaries()}")
+    index.update(2, taxes=900)
+    print(f"After raising employee 3's taxes: {index.calculate_salaries()}")
+    print(f"Employees 1-4 (min, max): {index.range_min_max(0, 3)}")
+    index.update(0, Employee(basic_salary=100, allowances=0, taxes=200, other_deductions=0))
+    print(f"After replacing employee 1: {index.calculate_salaries()}")
@@ -0,0 +1,74 @@
+import random
+import timeit
+
+from int_bruteforce import multiply
+from karatsuba import KARATSUBA_CUTOFF, karatsuba
+
+# Operand sizes, in bits, for the comparison table
+SIZES = [16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576]
+# Repeated addition runs |b| times, so it is only timed for small operands
+BRUTEFORCE_MAX_BITS = 16
+
+
+def time_call(func, x, y, min_time=0.2):
+    """Times one multiplication, repeating it until min_time seconds have passed.
+
+    Args:
+        func (callable): The multiplication function to time.
+        x (int): The first operand.
+        y (int): The second operand.
+        min_time (float): The minimum total measuring time in seconds.
+
+    Returns:
+        float: The best time per call in seconds.
+    """
+    timer = timeit.Timer(lambda: func(x, y))
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def compare(sizes=SIZES):
+    """Prints the time per multiplication for each algorithm and operand size.
+
+    Args:
+        sizes (list of int): Operand sizes in bits.
+    """
+    print(f"{'bits':>9} {'int.__mul__':>12} {'karatsuba':>12} {'bruteforce':>12}")
+    for bits in sizes:
+        x = random.getrandbits(bits) | (1 << (bits - 1))
+        y = random.getrandbits(bits) | (1 << (bits - 1))
+        assert karatsuba(x, y) == x * y
+        native = time_call(int.__mul__, x, y)
+        fast = time_call(karatsuba, x, y)
+        if bits <= BRUTEFORCE_MAX_BITS:
+            brute = f"{time_call(multiply, x, y):12.3e}"
+        else:
+            brute = f"{'skipped':>12}"
+        print(f"{bits:>9} {native:12.3e} {fast:12.3e} {brute}")
+
+
+def calibrate_cutoff(bits=262144, candidates=(256, 512, 1024, 2048, 4096, 8192, 16384)):
+    """Finds the native-multiply cutoff that makes karatsuba fastest.
+
+    Args:
+        bits (int): The operand size used for calibration.
+        candidates (tuple of int): Cutoffs, in bits, to try.
+
+    Returns:
+        int: The fastest cutoff.
+    """
+    x = random.getrandbits(bits)
+    y = random.getrandbits(bits)
+    timings = {cutoff: time_call(lambda a, b: karatsuba(a, b, cutoff), x, y)
+               for cutoff in candidates}
+    for cutoff, seconds in timings.items():
+        print(f"cutoff {cutoff:>6} bits: {seconds:.3e}s")
+    return min(timings, key=timings.get)
+
+
+if __name__ == "__main__":
+    compare()
+    print()
+    best = calibrate_cutoff()
+    print(f"Fastest cutoff: {best} bits (current KARATSUBA_CUTOFF = {KARATSUBA_CUTOFF})")
@@ -0,0 +1,105 @@
+import random
+import sys
+
+import multiplication
+from benchmark_karatsuba import time_call
+from karatsuba import KARATSUBA_CUTOFF, karatsuba
+
+# Operand sizes, in bits, tried when looking for each crossover
+SIZES = [1 << k for k in range(10, 23)]
+# The pure-Python NTT is slow, so it is only timed up to this size
+NTT_MAX_BITS = 1 << 20
+# Unbalanced shapes checked after calibration: (smaller operand bits, size ratio)
+UNBALANCED = [(100000, 1.5), (100000, 2), (20000, 150), (1 << 18, 4)]
+
+
+def _one_level(engine):
+    """Wraps an engine so its sub-products always use the native multiply."""
+    def run(x, y):
+        saved = (multiplication.KARATSUBA_THRESHOLD, multiplication.TOOM3_THRESHOLD,
+                 multiplication.NTT_THRESHOLD)
+        multiplication.KARATSUBA_THRESHOLD = None
+        multiplication.TOOM3_THRESHOLD = None
+        multiplication.NTT_THRESHOLD = None
+        try:
+            return engine(x, y)
+        finally:
+            (multiplication.KARATSUBA_THRESHOLD, multiplication.TOOM3_THRESHOLD,
+             multiplication.NTT_THRESHOLD) = saved
+    return run
+
+
+ENGINES = {
+    "karatsuba": lambda x, y: karatsuba(x, y, KARATSUBA_CUTOFF),
+    "toom3": _one_level(multiplication.toom3),
+    "ntt": multiplication.ntt_multiply,
+}
+
+
+def calibrate(sizes=SIZES):
+    """Finds, for each engine, the size from which it keeps beating the native multiply.
+
+    Args:
+        sizes (list of int): Operand sizes in bits, in increasing order.
+
+    Returns:
+        dict: The smallest size in bits from which the engine won at every
+            larger size tried, or None if it lost at the largest size.
+    """
+    thresholds = dict.fromkeys(ENGINES)
+    print(f"{'bits':>9} {'native':>11} " + " ".join(f"{name:>11}" for name in ENGINES))
+    for bits in sizes:
+        x = random.getrandbits(bits) | (1 << (bits - 1))
+        y = random.getrandbits(bits) | (1 << (bits - 1))
+        native = time_call(int.__mul__, x, y)
+        row = [f"{bits:>9}", f"{native:11.3e}"]
+        for name, engine in ENGINES.items():
+            if name == "ntt" and bits > NTT_MAX_BITS:
+                row.append(f"{'skipped':>11}")
+                continue
+            assert engine(x, y) == x * y
+            seconds = time_call(engine, x, y)
+            row.append(f"{seconds:11.3e}")
+            # A single noisy win is not enough; a loss resets the crossover
+            if seconds >= native:
+                thresholds[name] = None
+            elif thresholds[name] is None:
+                thresholds[name] = bits
+        print(" ".join(row))
+    return thresholds
+
+
+def check_unbalanced(shapes=UNBALANCED):
+    """Times multiply() against the native multiply on operands of different sizes.
+
+    Args:
+        shapes (list of tuple): (smaller operand bits, size ratio) pairs.
+
+    Returns:
+        list: The shapes on which multiply() was slower than the native multiply.
+    """
+    slower = []
+    print(f"{'bits':>9} {'ratio':>6} {'engine':>11} {'native':>11} {'multiply':>11}")
+    for bits, ratio in shapes:
+        x_bits = int(bits * ratio)
+        x = random.getrandbits(x_bits) | (1 << (x_bits - 1))
+        y = random.getrandbits(bits) | (1 << (bits - 1))
+        assert multiplication.multiply(x, y) == x * y
+        native = time_call(int.__mul__, x, y)
+        seconds = time_call(multiplication.multiply, x, y)
+        print(f"{bits:>9} {ratio:>6} {multiplication.select_engine(x, y):>11} "
+              f"{native:11.3e} {seconds:11.3e}")
+        if seconds >= native:
+            slower.append((bits, ratio))
+    return slower
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        SIZES = [1 << k for k in range(10, int(sys.argv[1]) + 1)]
+    result = calibrate(SIZES)
+    print()
+    for name, bits in result.items():
+        print(f"{name.upper()}_THRESHOLD = {bits}")
+    print()
+    check_unbalanced()
@@ -92,8 +92,10 @@ def count_inversions(arr):
     if not all(isinstance(x, (int, float)) for x in arr):
         raise TypeError("All elements of the array must be numbers.")
     
+    # Sort a copy so the caller's list is left untouched
+    work_arr = list(arr)
     temp_arr = [0] * len(arr)
-    return merge_sort_and_count(arr, temp_arr, 0, len(arr) - 1)
+    return merge_sort_and_count(work_arr, temp_arr, 0, len(arr) - 1)
 
 
 if __name__ == "__main__":
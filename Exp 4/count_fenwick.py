@@ -0,0 +1,163 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; large inputs then use the Fenwick engine
+    np = None
+
+from count_divide_conquer import merge_sort_and_count
+
+# Inputs shorter than this are counted with the plain merge sort
+MERGE_SORT_CUTOFF = 64
+# Inputs at least this long use the vectorized merge when NumPy is available
+NUMPY_CUTOFF = 100000
+
+
+def validate_array(arr):
+    """Applies the input checks shared by every inversion counter.
+
+    Args:
+        arr (list or numpy.ndarray): The numbers to check.
+
+    Raises:
+        ValueError: If the array is empty or has less than 10 elements.
+        TypeError: If any element in the array is not a number.
+    """
+    # Check for empty array
+    if len(arr) == 0:
+        raise ValueError("The array is empty.")
+
+    # Check for array length
+    if len(arr) < 10:
+        raise ValueError("The array must have at least 10 elements.")
+
+    # Check for non-numeric elements; typed arrays are checked by dtype alone
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.dtype.kind not in "biuf":
+            raise TypeError("All elements of the array must be numbers.")
+    elif not all(isinstance(x, (int, float)) for x in arr):
+        raise TypeError("All elements of the array must be numbers.")
+
+
+def compress(arr):
+    """Maps values to dense ranks 1..k that preserve their order.
+
+    Args:
+        arr (list): The numbers to compress.
+
+    Returns:
+        list: The rank of each value, equal values sharing a rank.
+    """
+    ranks = {value: rank for rank, value in enumerate(sorted(set(arr)), start=1)}
+    return [ranks[value] for value in arr]
+
+
+def count_fenwick(arr):
+    """Counts inversions with coordinate compression and a Fenwick tree.
+
+    Elements are scanned right to left; for each one the tree reports how many
+    already-seen (later) elements are strictly smaller. The input is not modified.
+
+    Args:
+        arr (list): The numbers to count inversions in.
+
+    Returns:
+        int: The number of inversions in the array.
+    """
+    ranks = compress(arr)
+    size = max(ranks, default=0)
+    tree = [0] * (size + 1)
+    inv_count = 0
+    for rank in reversed(ranks):
+        # Query how many seen elements have a rank below this one
+        i = rank - 1
+        while i > 0:
+            inv_count += tree[i]
+            i -= i & -i
+        # Record this element
+        i = rank
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return inv_count
+
+
+def count_numpy_merge(arr):
+    """Counts inversions with a bottom-up merge sort vectorized in NumPy.
+
+    At each level every pair of neighbouring sorted runs is handled at once:
+    elements are keyed by (pair id, rank) so one searchsorted over all left
+    runs counts, for every right-run element, the larger left-run elements,
+    and one stable sort of the keys merges all pairs.
+
+    Args:
+        arr (list or numpy.ndarray): The numbers to count inversions in.
+
+    Returns:
+        int: The number of inversions in the array.
+    """
+    _, ranks = np.unique(np.asarray(arr), return_inverse=True)
+    values = ranks.astype(np.int64).ravel()
+    n = len(values)
+    positions = np.arange(n, dtype=np.int64)
+    inv_count = 0
+    width = 1
+    while width < n:
+        pair = positions // (2 * width)
+        keys = pair * n + values
+        is_left = (positions % (2 * width)) < width
+
+        left_keys = keys[is_left]
+        right_keys = keys[~is_left]
+        right_pairs = pair[~is_left]
+        if len(right_keys):
+            # Left elements of the same pair that are <= each right element
+            pair_start = np.searchsorted(left_keys, right_pairs * n, side="left")
+            not_greater = np.searchsorted(left_keys, right_keys, side="right") - pair_start
+            left_sizes = np.minimum(width, n - right_pairs * 2 * width)
+            inv_count += int((left_sizes - not_greater).sum())
+
+        values = np.sort(keys, kind="stable") - pair * n
+        width *= 2
+    return inv_count
+
+
+def count_inversions(arr):
+    """Counts inversions, choosing the engine by input size and type.
+
+    Args:
+        arr (list or numpy.ndarray): The list of numbers to check for inversions.
+
+    Returns:
+        int: The number of inversions in the array.
+
+    Raises:
+        ValueError: If the array is empty or has less than 10 elements.
+        TypeError: If any element in the array is not a number.
+    """
+    validate_array(arr)
+
+    n = len(arr)
+    if np is not None and (n >= NUMPY_CUTOFF or isinstance(arr, np.ndarray)):
+        return count_numpy_merge(arr)
+    if n < MERGE_SORT_CUTOFF:
+        work = list(arr)
+        return merge_sort_and_count(work, [0] * n, 0, n - 1)
+    return count_fenwick(arr)
+
+
+if __name__ == "__main__":
+    test_cases = [
+        [23491, 23571, 23497, 23321, 23499, 23731, 23892, 23554, 23901, 23956],  # Valid case
+        [23231, 23321, 23345, 23452, 23552, 23567, 23681, 23790, 23888, 23991],  # Valid case
+        [23590, 23791, 23214, 23413, 23521, 23771, 23839, 23415, 23115, 23557],  # Valid case
+        list(range(1000, 0, -1)),  # Valid case large enough for the Fenwick engine
+        [23390, 23591, 23431],  # Less than 10 elements
+        [],  # Empty array
+        [23590, 23791, 23214, 23413, 23521, 23771, 23839, 23415, 23115, "23557"],  # Non-numeric element
+    ]
+
+    for i, test_case in enumerate(test_cases):
+        try:
+            result = count_inversions(test_case)
+            print(f"Test case {i + 1}: {len(test_case)} elements -> Number of inversions: {result}")
+        except (ValueError, TypeError) as e:
+            print(f"Test case {i + 1}: {test_case} -> {e}")
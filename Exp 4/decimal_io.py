@@ -0,0 +1,203 @@
+import decimal
+import sys
+from functools import lru_cache
+
+from multiplication import multiply
+
+# Digit strings up to this length are converted directly by int(); it stays
+# well below CPython's default int/str conversion limit of 4300 digits
+PARSE_CHUNK = 2048
+# Integers up to this many bits are converted directly to Decimal
+FORMAT_CHUNK_BITS = 4096
+
+
+@lru_cache(maxsize=None)
+def power_of_ten(exponent):
+    """Returns 10 ** exponent, caching the values used by the splits.
+
+    Exponents of the form PARSE_CHUNK * 2^j are built by squaring the cached
+    half power, so each one costs a single large multiplication.
+
+    Args:
+        exponent (int): The non-negative power of ten.
+
+    Returns:
+        int: 10 raised to exponent.
+    """
+    if exponent <= PARSE_CHUNK or exponent % 2:
+        return 10 ** exponent
+    half = power_of_ten(exponent // 2)
+    return multiply(half, half)
+
+
+def parse_decimal(text):
+    """Converts a decimal string to an integer in subquadratic time.
+
+    The digit string is split so that its low part has PARSE_CHUNK * 2^j
+    digits; both halves are converted recursively and joined as
+    high * 10^k + low using the size-dispatched multiply.
+
+    Args:
+        text (str): An optional sign followed by decimal digits; surrounding
+            whitespace and single underscores between digits are allowed, as
+            in int().
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        ValueError: If the text is not a valid decimal integer.
+    """
+    digits = text.strip()
+    negative = digits.startswith("-")
+    if digits[:1] in "+-":
+        digits = digits[1:]
+    if digits.startswith("_") or digits.endswith("_") or "__" in digits:
+        raise ValueError(f"invalid literal for parse_decimal(): {text!r}")
+    digits = digits.replace("_", "")
+    if not digits or not digits.isascii() or not digits.isdigit():
+        raise ValueError(f"invalid literal for parse_decimal(): {text!r}")
+    value = _parse_digits(digits)
+    return -value if negative else value
+
+
+def _parse_digits(digits):
+    """Recursively converts a string of decimal digits to an integer."""
+    if len(digits) <= PARSE_CHUNK:
+        return int(digits)
+    low_len = PARSE_CHUNK
+    while 2 * low_len < len(digits):
+        low_len *= 2
+    high = _parse_digits(digits[:-low_len])
+    low = _parse_digits(digits[-low_len:])
+    return multiply(high, power_of_ten(low_len)) + low
+
+
+def format_decimal(n):
+    """Converts an integer to its decimal string in subquadratic time.
+
+    The integer is split on bit boundaries and rebuilt as a Decimal with
+    exact arithmetic (libmpdec multiplies large operands with a
+    number-theoretic transform), then printed, which is linear.
+
+    Args:
+        n (int): The integer to format.
+
+    Returns:
+        str: The decimal representation of n.
+    """
+    if n.bit_length() <= FORMAT_CHUNK_BITS:
+        return str(n)
+
+    with decimal.localcontext() as context:
+        context.prec = decimal.MAX_PREC
+        context.Emax = decimal.MAX_EMAX
+        context.Emin = decimal.MIN_EMIN
+        context.traps[decimal.Inexact] = True
+        powers = {}
+
+        def power_of_two(exponent):
+            if exponent not in powers:
+                powers[exponent] = decimal.Decimal(2) ** exponent
+            return powers[exponent]
+
+        def to_decimal(value, bits):
+            if bits <= FORMAT_CHUNK_BITS:
+                return decimal.Decimal(value)
+            half = bits >> 1
+            high = value >> half
+            low = value & ((1 << half) - 1)
+            return to_decimal(high, bits - half) * power_of_two(half) + to_decimal(low, half)
+
+        result = to_decimal(abs(n), abs(n).bit_length())
+        text = format(result, "f")
+    return "-" + text if n < 0 else text
+
+
+def read_operand_pairs(path):
+    """Reads pairs of integers from a file, one pair per line.
+
+    The two operands on a line are separated by whitespace or a comma; blank
+    lines and lines starting with '#' are skipped.
+
+    Args:
+        path (str): Path to the operand file.
+
+    Yields:
+        tuple: The line number and the two parsed integers.
+
+    Raises:
+        ValueError: If a line does not hold exactly two valid integers.
+    """
+    with open(path) as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.replace(",", " ").split()
+            if len(fields) != 2:
+                raise ValueError(f"Line {line_number}: expected two integers, got {len(fields)}.")
+            try:
+                a, b = parse_decimal(fields[0]), parse_decimal(fields[1])
+            except ValueError as error:
+                raise ValueError(f"Line {line_number}: {error}") from None
+            yield line_number, a, b
+
+
+def run_batch(path, multiply_func, output=None):
+    """Multiplies every operand pair in a file and streams the products.
+
+    Args:
+        path (str): Path to the operand file read by read_operand_pairs.
+        multiply_func (callable): The multiplication to apply to each pair.
+        output (file): Where to write one product per line; stdout if None.
+
+    Returns:
+        int: The number of products written.
+    """
+    output = output or sys.stdout
+    count = 0
+    for _, a, b in read_operand_pairs(path):
+        output.write(format_decimal(multiply_func(a, b)))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def batch_main(args, multiply_func):
+    """Runs batch mode for a multiplication CLI and reports errors like its prompt.
+
+    Args:
+        args (list of str): The operand file, optionally followed by an output file.
+        multiply_func (callable): The multiplication to apply to each pair.
+
+    Returns:
+        bool: True if every pair was multiplied, False if an error was reported.
+    """
+    try:
+        if len(args) > 1:
+            with open(args[1], "w") as output:
+                run_batch(args[0], multiply_func, output)
+        else:
+            run_batch(args[0], multiply_func)
+    except ValueError as error:
+        print(f"Please enter valid integers. {error}")
+        return False
+    except OSError as error:
+        print(f"An error occurred: {error}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    n = random.getrandbits(1 << 20)
+    started = time.perf_counter()
+    text = format_decimal(n)
+    print(f"Formatted {len(text)} digits in {time.perf_counter() - started:.2f}s")
+    started = time.perf_counter()
+    parsed = parse_decimal(text)
+    print(f"Parsed {len(text)} digits in {time.perf_counter() - started:.2f}s, "
+          f"round trip correct = {parsed == n}")
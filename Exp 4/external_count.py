@@ -0,0 +1,200 @@
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+
+from count_divide_conquer import merge_sort_and_count
+
+# Fixed-width formats supported for binary input files and sorted runs
+TYPECODES = {"int64": "q", "float64": "d"}
+# Rough in-memory cost of one element during a run sort (list, temp list, objects)
+BYTES_PER_ELEMENT = 80
+# Default memory budget for the whole count
+DEFAULT_BUDGET = 256 * 1024 * 1024
+
+
+def read_numbers(path, file_format="text", dtype="int64", chunk_size=1 << 16):
+    """Reads numbers from a text or binary file in chunks.
+
+    Args:
+        path (str): Path to the input file.
+        file_format (str): "text" for one number per line, or "binary" for
+            native fixed-width values.
+        dtype (str): The value type, "int64" or "float64".
+        chunk_size (int): The number of values per chunk.
+
+    Yields:
+        array: The next chunk of values.
+
+    Raises:
+        ValueError: If the dtype or format is unsupported.
+        TypeError: If a line of a text file is not a number.
+    """
+    if dtype not in TYPECODES:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    typecode = TYPECODES[dtype]
+
+    if file_format == "binary":
+        with open(path, "rb") as file:
+            while True:
+                chunk = array(typecode)
+                try:
+                    chunk.fromfile(file, chunk_size)
+                except EOFError:
+                    # fromfile keeps the values it managed to read before the end
+                    pass
+                if not chunk:
+                    return
+                yield chunk
+    elif file_format == "text":
+        parse = int if dtype == "int64" else float
+        with open(path) as file:
+            chunk = array(typecode)
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    chunk.append(parse(line))
+                except ValueError:
+                    raise TypeError("All elements of the array must be numbers.") from None
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = array(typecode)
+            if chunk:
+                yield chunk
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def _read_run(path, typecode, block_size):
+    """Yields the values of one sorted run file, reading block_size values at a time."""
+    with open(path, "rb") as file:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(file, block_size)
+            except EOFError:
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def _tagged(values, run):
+    """Pairs each value of a run with the run index, so ties merge earlier runs first."""
+    for value in values:
+        yield value, run
+
+
+def external_count_inversions(path, file_format="text", dtype="int64",
+                              memory_budget=DEFAULT_BUDGET, temp_dir=None):
+    """Counts inversions in a file too large to hold in memory.
+
+    The file is cut into runs that fit the memory budget; each run is counted
+    and sorted with merge_sort_and_count and written to a temporary file.
+    The runs are then k-way merged from disk. When a value is emitted from
+    run r, every value still pending in an earlier run is strictly larger
+    (ties leave earlier runs first), so a Fenwick tree over the pending
+    counts of the runs gives the cross-run inversions in O(log k).
+
+    Args:
+        path (str): Path to the input file.
+        file_format (str): "text" for one number per line, or "binary" for
+            native fixed-width values.
+        dtype (str): The value type, "int64" or "float64".
+        memory_budget (int): The approximate memory cap in bytes.
+        temp_dir (str): Directory for the sorted run files; the system
+            default if None.
+
+    Returns:
+        int: The number of inversions in the file.
+
+    Raises:
+        ValueError: If the file is empty or has less than 10 elements.
+        TypeError: If any element in a text file is not a number.
+    """
+    typecode = TYPECODES.get(dtype)
+    run_length = max(1, memory_budget // BYTES_PER_ELEMENT)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        run_paths = []
+        run_sizes = []
+        inv_count = 0
+
+        # Phase 1: count and sort memory-sized runs
+        run = []
+        for chunk in read_numbers(path, file_format, dtype, min(run_length, 1 << 16)):
+            pos = 0
+            while pos < len(chunk):
+                take = run_length - len(run)
+                run.extend(chunk[pos:pos + take])
+                pos += take
+                if len(run) == run_length:
+                    inv_count += _flush_run(run, typecode, work_dir, run_paths, run_sizes)
+                    run = []
+        if run:
+            inv_count += _flush_run(run, typecode, work_dir, run_paths, run_sizes)
+
+        total = sum(run_sizes)
+        # Check for empty array
+        if total == 0:
+            raise ValueError("The array is empty.")
+
+        # Check for array length
+        if total < 10:
+            raise ValueError("The array must have at least 10 elements.")
+
+        if len(run_paths) == 1:
+            return inv_count
+
+        # Phase 2: k-way merge, adding the pending count of earlier runs
+        k = len(run_paths)
+        tree = [0] * (k + 1)
+        for r, size in enumerate(run_sizes, start=1):
+            tree[r] += size
+            parent = r + (r & -r)
+            if parent <= k:
+                tree[parent] += tree[r]
+
+        block_size = max(1, memory_budget // (2 * k * array(typecode).itemsize))
+        streams = [_tagged(_read_run(run_path, typecode, block_size), r)
+                   for r, run_path in enumerate(run_paths)]
+        for _, r in heapq.merge(*streams):
+            # Pending values in runs 0..r-1
+            i = r
+            while i > 0:
+                inv_count += tree[i]
+                i -= i & -i
+            # This value is no longer pending
+            i = r + 1
+            while i <= k:
+                tree[i] -= 1
+                i += i & -i
+    return inv_count
+
+
+def _flush_run(run, typecode, work_dir, run_paths, run_sizes):
+    """Sorts one run, writes it to a temporary file and returns its inversion count."""
+    inv_count = merge_sort_and_count(run, [0] * len(run), 0, len(run) - 1)
+    run_path = os.path.join(work_dir, f"run_{len(run_paths)}.bin")
+    with open(run_path, "wb") as file:
+        array(typecode, run).tofile(file)
+    run_paths.append(run_path)
+    run_sizes.append(len(run))
+    return inv_count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python external_count.py <numbers.txt|numbers.bin> "
+              "[text|binary] [int64|float64] [memory_budget_bytes]")
+        sys.exit(1)
+    fmt = sys.argv[2] if len(sys.argv) > 2 else "text"
+    value_type = sys.argv[3] if len(sys.argv) > 3 else "int64"
+    budget = int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_BUDGET
+    try:
+        result = external_count_inversions(sys.argv[1], fmt, value_type, budget)
+        print(f"{sys.argv[1]} -> Number of inversions: {result}")
+    except (ValueError, TypeError) as e:
+        print(f"{sys.argv[1]} -> {e}")
@@ -1,3 +1,6 @@
+import sys
+
+
 def multiply(a, b):
     """Multiply two integers using a for loop.
 
@@ -19,15 +22,24 @@ def multiply(a, b):
 
 def main():
     """Main function to execute the multiplication."""
+    from decimal_io import batch_main, format_decimal, parse_decimal
+
+    if len(sys.argv) > 1:
+        # Batch mode: python int_bruteforce.py <pairs.txt> [output.txt]
+        if not batch_main(sys.argv[1:], multiply):
+            sys.exit(1)
+        return
+
     try:
         # Input: Get two integers from the user
-        num1 = int(input("Enter the first integer: "))
-        num2 = int(input("Enter the second integer: "))
+        num1 = parse_decimal(input("Enter the first integer: "))
+        num2 = parse_decimal(input("Enter the second integer: "))
         # Process: Multiply the two integers
         result = multiply(num1, num2)
 
         # Output: Display the result
-        print(f"The result of {num1} * {num2} is: {result}")
+        print(f"The result of {format_decimal(num1)} * {format_decimal(num2)} "
+              f"is: {format_decimal(result)}")
     except ValueError:
         print("Please enter valid integers.")
 
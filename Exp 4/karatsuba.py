@@ -1,51 +1,89 @@
-def karatsuba(x, y):
-    """Recursive Karatsuba multiplication algorithm.
+import sys
+
+# Operands narrower than this many bits are multiplied natively; measured with
+# benchmark_karatsuba.py, below it the split/recombine overhead dominates
+KARATSUBA_CUTOFF = 16384
+
+
+def karatsuba(x, y, cutoff=KARATSUBA_CUTOFF):
+    """Recursive Karatsuba multiplication algorithm on binary limbs.
+
+    Operands are split on a bit boundary with shifts and masks instead of
+    decimal divisions, and small operands fall back to native multiplication.
 
     Args:
         x (int): The first integer.
         y (int): The second integer.
+        cutoff (int): Bit length below which the native multiply is used.
+
+    Returns:
+        int: The product of x and y.
+    """
+    # Work on magnitudes and restore the sign at the end
+    negative = (x < 0) != (y < 0)
+    product = _karatsuba(abs(x), abs(y), max(cutoff, 2))
+    return -product if negative else product
+
+
+def _karatsuba(x, y, cutoff):
+    """Multiplies two non-negative integers with Karatsuba recursion.
+
+    Args:
+        x (int): The first non-negative integer.
+        y (int): The second non-negative integer.
+        cutoff (int): Bit length below which the native multiply is used.
 
     Returns:
         int: The product of x and y.
     """
     # Base case for recursion
-    if x < 10 or y < 10:
+    x_bits, y_bits = x.bit_length(), y.bit_length()
+    if x_bits < cutoff or y_bits < cutoff:
         return x * y
 
-    # Calculate the size of the numbers
-    max_len = max(len(str(x)), len(str(y)))
-    half_len = max_len // 2
-
-    # Split the digit sequences about the half_len
-    x_high = x // (10 ** half_len)
-    x_low = x % (10 ** half_len)
-    y_high = y // (10 ** half_len)
-    y_low = y % (10 ** half_len)
+    # Split both operands at the same bit position
+    half_bits = max(x_bits, y_bits) // 2
+    mask = (1 << half_bits) - 1
+    x_high, x_low = x >> half_bits, x & mask
+    y_high, y_low = y >> half_bits, y & mask
 
     # 3 recursive calls
-    z0 = karatsuba(x_low, y_low)  # Low parts
-    z1 = karatsuba(x_low + x_high, y_low + y_high)  # Cross parts
-    z2 = karatsuba(x_high, y_high)  # High parts
+    z0 = _karatsuba(x_low, y_low, cutoff)  # Low parts
+    z1 = _karatsuba(x_low + x_high, y_low + y_high, cutoff)  # Cross parts
+    z2 = _karatsuba(x_high, y_high, cutoff)  # High parts
 
     # Combine the results using the Karatsuba formula
-    return (z2 * (10 ** (2 * half_len))) + \
-           ((z1 - z2 - z0) * (10 ** half_len)) + z0
+    return (z2 << (2 * half_bits)) + ((z1 - z2 - z0) << half_bits) + z0
 
 
-if __name__ == "__main__":
+def main():
+    """Runs the interactive prompt, or batch mode when an operand file is given."""
+    from decimal_io import batch_main, format_decimal, parse_decimal
+
+    if len(sys.argv) > 1:
+        # Batch mode: python karatsuba.py <pairs.txt> [output.txt]
+        if not batch_main(sys.argv[1:], karatsuba):
+            sys.exit(1)
+        return
+
     while True:
         try:
             num1 = input("Enter the first integer: ")
             num2 = input("Enter the second integer: ")
 
             # Convert inputs to integers
-            num1 = int(num1)
-            num2 = int(num2)
+            num1 = parse_decimal(num1)
+            num2 = parse_decimal(num2)
 
             result = karatsuba(num1, num2)
-            print(f"The result of {num1} * {num2} using Karatsuba is: {result}")
+            print(f"The result of {format_decimal(num1)} * {format_decimal(num2)} "
+                  f"using Karatsuba is: {format_decimal(result)}")
             break  # Exit loop after successful calculation
         except ValueError:
             print("Please enter valid integers.")
         except Exception as e:
-            print(f"An error occurred: {e}. Please try again.")
\ No newline at end of file
+            print(f"An error occurred: {e}. Please try again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from count_fenwick import NUMPY_CUTOFF, count_numpy_merge, np
+
+# Position map installed once per worker process by _init_worker
+_worker_positions = None
+
+
+def position_map(reference):
+    """Maps every item of the reference ranking to its position.
+
+    Args:
+        reference (list): The reference ranking, best item first.
+
+    Returns:
+        dict: The position of each item.
+
+    Raises:
+        ValueError: If the reference ranking contains duplicate items.
+    """
+    positions = {item: i for i, item in enumerate(reference)}
+    if len(positions) != len(reference):
+        raise ValueError("The reference ranking contains duplicate items.")
+    return positions
+
+
+def count_permutation_inversions(permutation):
+    """Counts inversions in a permutation of 0..n-1 with a Fenwick tree.
+
+    The values are already dense ranks, so no coordinate compression is needed.
+
+    Args:
+        permutation (list): A permutation of 0..n-1.
+
+    Returns:
+        int: The number of inversions in the permutation.
+    """
+    n = len(permutation)
+    if np is not None and n >= NUMPY_CUTOFF:
+        return count_numpy_merge(permutation)
+    tree = [0] * (n + 1)
+    inv_count = 0
+    for seen, value in enumerate(permutation):
+        # Earlier values that are larger than this one
+        not_greater = 0
+        i = value + 1
+        while i > 0:
+            not_greater += tree[i]
+            i -= i & -i
+        inv_count += seen - not_greater
+        i = value + 1
+        while i <= n:
+            tree[i] += 1
+            i += i & -i
+    return inv_count
+
+
+def _distance(positions, candidate):
+    """Scores one candidate ranking against a precomputed position map."""
+    if len(candidate) != len(positions):
+        raise ValueError("The rankings must contain the same items.")
+    try:
+        permutation = [positions[item] for item in candidate]
+    except KeyError:
+        raise ValueError("The rankings must contain the same items.") from None
+    if len(set(permutation)) != len(permutation):
+        raise ValueError("The rankings must contain the same items.")
+    return count_permutation_inversions(permutation)
+
+
+def kendall_tau(reference, candidate):
+    """Computes the Kendall-tau distance between two rankings.
+
+    The distance is the number of item pairs the two rankings order
+    differently, i.e. the inversion count of the candidate written in
+    reference positions.
+
+    Args:
+        reference (list): The reference ranking.
+        candidate (list): A ranking of the same items.
+
+    Returns:
+        int: The Kendall-tau distance.
+
+    Raises:
+        ValueError: If the rankings do not contain the same distinct items.
+    """
+    return _distance(position_map(reference), candidate)
+
+
+def _init_worker(positions):
+    """Installs the reference position map in a worker process."""
+    global _worker_positions
+    _worker_positions = positions
+
+
+def _worker_distance(candidate):
+    """Scores one candidate inside a worker process."""
+    return _distance(_worker_positions, candidate)
+
+
+def kendall_tau_many(reference, candidates, workers=None, chunksize=256):
+    """Computes the Kendall-tau distance of many candidates to one reference.
+
+    The reference position map is built once and, in parallel mode, sent once
+    to each worker process; candidates are then scored in batches.
+
+    Args:
+        reference (list): The reference ranking.
+        candidates (iterable of list): Rankings of the same items.
+        workers (int): The number of worker processes; 1 scores serially and
+            None uses the CPU count.
+        chunksize (int): The number of candidates sent to a worker at a time.
+
+    Returns:
+        list: The Kendall-tau distance of each candidate, in order.
+
+    Raises:
+        ValueError: If any ranking does not contain the reference's items.
+    """
+    positions = position_map(reference)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [_distance(positions, candidate) for candidate in candidates]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(positions,)) as pool:
+        return list(pool.map(_worker_distance, candidates, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    reference = ["A", "B", "C", "D", "E"]
+    candidates = [
+        ["A", "B", "C", "D", "E"],  # Identical ranking
+        ["E", "D", "C", "B", "A"],  # Reversed ranking
+        ["B", "A", "C", "E", "D"],  # Two adjacent swaps
+    ]
+    for candidate, distance in zip(candidates, kendall_tau_many(reference, candidates, workers=2)):
+        print(f"{candidate} -> Kendall-tau distance: {distance}")
+
+    try:
+        kendall_tau(reference, ["A", "B", "C", "D", "F"])
+    except ValueError as e:
+        print(f"['A', 'B', 'C', 'D', 'F'] -> {e}")
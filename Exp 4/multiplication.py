@@ -0,0 +1,248 @@
+from karatsuba import _karatsuba
+
+# Size thresholds, in bits of the smaller operand, at which multiply() switches
+# engine. They are calibrated with benchmark_multiplication.py; None disables
+# an engine that never won on the calibration machine.
+KARATSUBA_THRESHOLD = None
+TOOM3_THRESHOLD = 1 << 14
+NTT_THRESHOLD = None
+# The engines split both operands by the larger one's size, so when it has
+# more than this many times the bits of the smaller one the native multiply
+# is used instead
+BALANCE_RATIO = 1.5
+
+# NTT parameters: 16-bit limbs convolved modulo the prime 2^64 - 2^32 + 1,
+# whose multiplicative group has a subgroup of order 2^32 generated from 7.
+# A coefficient of the convolution is below n * 2^32, so it is exact for any
+# transform length up to 2^32.
+LIMB_BITS = 16
+NTT_PRIME = (1 << 64) - (1 << 32) + 1
+NTT_GENERATOR = 7
+NTT_MAX_LOG = 32
+
+
+def to_limbs(n, limb_bits=LIMB_BITS):
+    """Splits a non-negative integer into little-endian limbs.
+
+    Args:
+        n (int): The non-negative integer to split.
+        limb_bits (int): The width of each limb in bits; a multiple of 8.
+
+    Returns:
+        list of int: The limbs, least significant first.
+    """
+    limb_bytes = limb_bits // 8
+    data = n.to_bytes(max(1, (n.bit_length() + 7) // 8), "little")
+    data += bytes(-len(data) % limb_bytes)
+    return [int.from_bytes(data[i:i + limb_bytes], "little")
+            for i in range(0, len(data), limb_bytes)]
+
+
+def from_limbs(limbs, limb_bits=LIMB_BITS):
+    """Joins little-endian limbs, which may exceed the limb width, into an integer.
+
+    Args:
+        limbs (list of int): The limbs, least significant first.
+        limb_bits (int): The width of each limb in bits.
+
+    Returns:
+        int: The integer sum of limbs[i] * 2^(i * limb_bits).
+    """
+    # Carry-propagate so every limb fits, then join the bytes in one pass
+    limb_bytes = limb_bits // 8
+    mask = (1 << limb_bits) - 1
+    carry = 0
+    data = bytearray()
+    for limb in limbs:
+        carry += limb
+        data += (carry & mask).to_bytes(limb_bytes, "little")
+        carry >>= limb_bits
+    return int.from_bytes(data, "little") + (carry << (limb_bits * len(limbs)))
+
+
+def _ntt(values, invert=False):
+    """Transforms values in place with an iterative radix-2 number-theoretic transform.
+
+    Args:
+        values (list of int): Residues modulo NTT_PRIME; the length is a power of two.
+        invert (bool): Whether to compute the inverse transform.
+    """
+    n = len(values)
+    p = NTT_PRIME
+
+    # Bit-reversal permutation
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            values[i], values[j] = values[j], values[i]
+
+    length = 2
+    while length <= n:
+        root = pow(NTT_GENERATOR, (p - 1) // length, p)
+        if invert:
+            root = pow(root, p - 2, p)
+        half = length // 2
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k - 1] * root % p
+        for start in range(0, n, length):
+            for k in range(half):
+                u = values[start + k]
+                v = values[start + k + half] * twiddles[k] % p
+                values[start + k] = (u + v) % p
+                values[start + k + half] = (u - v) % p
+        length *= 2
+
+    if invert:
+        inverse_n = pow(n, p - 2, p)
+        for i in range(n):
+            values[i] = values[i] * inverse_n % p
+
+
+def ntt_multiply(x, y):
+    """Multiplies two integers by NTT convolution of their 16-bit limbs.
+
+    Args:
+        x (int): The first integer.
+        y (int): The second integer.
+
+    Returns:
+        int: The product of x and y.
+
+    Raises:
+        ValueError: If the operands are too large for a 2^32-point transform.
+    """
+    negative = (x < 0) != (y < 0)
+    x, y = abs(x), abs(y)
+    if x == 0 or y == 0:
+        return 0
+
+    x_limbs, y_limbs = to_limbs(x), to_limbs(y)
+    size = 1
+    while size < len(x_limbs) + len(y_limbs):
+        size *= 2
+    if size > 1 << NTT_MAX_LOG:
+        raise ValueError("Operands are too large for the NTT modulus.")
+
+    fx = x_limbs + [0] * (size - len(x_limbs))
+    fy = y_limbs + [0] * (size - len(y_limbs))
+    _ntt(fx)
+    _ntt(fy)
+    product = [a * b % NTT_PRIME for a, b in zip(fx, fy)]
+    _ntt(product, invert=True)
+
+    result = from_limbs(product)
+    return -result if negative else result
+
+
+def toom3(x, y):
+    """Multiplies two integers with one level of Toom-Cook-3.
+
+    Each operand is split into three bit-aligned parts, the part polynomials
+    are evaluated at 0, 1, -1, -2 and infinity, the five point products are
+    computed with multiply(), and the result is interpolated with Bodrato's
+    sequence.
+
+    Args:
+        x (int): The first integer.
+        y (int): The second integer.
+
+    Returns:
+        int: The product of x and y.
+    """
+    negative = (x < 0) != (y < 0)
+    x, y = abs(x), abs(y)
+
+    part_bits = (max(x.bit_length(), y.bit_length()) + 2) // 3
+    mask = (1 << part_bits) - 1
+    x0, x1, x2 = x & mask, (x >> part_bits) & mask, x >> (2 * part_bits)
+    y0, y1, y2 = y & mask, (y >> part_bits) & mask, y >> (2 * part_bits)
+
+    # Evaluation
+    x_02, y_02 = x0 + x2, y0 + y2
+    x_1, y_1 = x_02 + x1, y_02 + y1
+    x_m1, y_m1 = x_02 - x1, y_02 - y1
+    x_m2, y_m2 = ((x_m1 + x2) << 1) - x0, ((y_m1 + y2) << 1) - y0
+
+    r0 = multiply(x0, y0)
+    r1 = multiply(x_1, y_1)
+    rm1 = multiply(x_m1, y_m1)
+    rm2 = multiply(x_m2, y_m2)
+    rinf = multiply(x2, y2)
+
+    # Interpolation (all divisions are exact)
+    c3 = (rm2 - r1) // 3
+    c1 = (r1 - rm1) >> 1
+    c2 = rm1 - r0
+    c3 = ((c2 - c3) >> 1) + (rinf << 1)
+    c2 = c2 + c1 - rinf
+    c1 = c1 - c3
+
+    result = (r0 + (c1 << part_bits) + (c2 << (2 * part_bits))
+              + (c3 << (3 * part_bits)) + (rinf << (4 * part_bits)))
+    return -result if negative else result
+
+
+def select_engine(x, y):
+    """Names the engine multiply() uses for the given operands.
+
+    Args:
+        x (int): The first integer.
+        y (int): The second integer.
+
+    Returns:
+        str: One of "schoolbook", "karatsuba", "toom3" or "ntt".
+    """
+    bits, max_bits = sorted((abs(x).bit_length(), abs(y).bit_length()))
+    if max_bits > BALANCE_RATIO * bits:
+        return "schoolbook"
+    if NTT_THRESHOLD is not None and bits >= NTT_THRESHOLD:
+        return "ntt"
+    if TOOM3_THRESHOLD is not None and bits >= TOOM3_THRESHOLD:
+        return "toom3"
+    if KARATSUBA_THRESHOLD is not None and bits >= KARATSUBA_THRESHOLD:
+        return "karatsuba"
+    return "schoolbook"
+
+
+def multiply(x, y):
+    """Multiplies two integers, dispatching on operand size.
+
+    Below every threshold the native multiply is used, which is CPython's
+    schoolbook (and, for large operands, its built-in Karatsuba) in C.
+
+    Args:
+        x (int): The first integer.
+        y (int): The second integer.
+
+    Returns:
+        int: The product of x and y.
+    """
+    engine = select_engine(x, y)
+    if engine == "ntt":
+        return ntt_multiply(x, y)
+    if engine == "toom3":
+        return toom3(x, y)
+    if engine == "karatsuba":
+        negative = (x < 0) != (y < 0)
+        product = _karatsuba(abs(x), abs(y), KARATSUBA_THRESHOLD)
+        return -product if negative else product
+    return x * y
+
+
+if __name__ == "__main__":
+    import random
+
+    for bits in (100, 5000, 100000, 1000000):
+        a = random.getrandbits(bits)
+        b = -random.getrandbits(bits)
+        product = multiply(a, b)
+        print(f"{bits} bits via {select_engine(a, b)}: correct = {product == a * b}")
+    a, b = random.getrandbits(20000), random.getrandbits(20000)
+    print(f"NTT on 20000 bits: correct = {ntt_multiply(a, b) == a * b}")
+    print(f"Toom-3 on 20000 bits: correct = {toom3(a, b) == a * b}")
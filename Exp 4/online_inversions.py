@@ -0,0 +1,219 @@
+import random
+from collections import deque
+
+
+class _TreapNode:
+    """A treap node holding one distinct value and how often it occurs."""
+
+    __slots__ = ("value", "count", "size", "priority", "left", "right")
+
+    def __init__(self, value):
+        self.value = value
+        self.count = 1
+        self.size = 1
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    node.size = node.count + _size(node.left) + _size(node.right)
+
+
+class OrderStatisticTree:
+    """A multiset of numbers with O(log n) expected insert, remove and rank queries."""
+
+    def __init__(self):
+        """Initializes an empty tree."""
+        self.root = None
+
+    def __len__(self):
+        return _size(self.root)
+
+    def insert(self, value):
+        """Adds one occurrence of value.
+
+        Args:
+            value (int or float): The value to add.
+        """
+        self.root = self._insert(self.root, value)
+
+    def remove(self, value):
+        """Removes one occurrence of value.
+
+        Args:
+            value (int or float): The value to remove.
+
+        Raises:
+            KeyError: If the value is not present.
+        """
+        self.root = self._remove(self.root, value)
+
+    def count_less(self, value):
+        """Counts the stored values strictly smaller than value."""
+        total = 0
+        node = self.root
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                total += _size(node.left) + node.count
+                node = node.right
+        return total
+
+    def count_greater(self, value):
+        """Counts the stored values strictly larger than value."""
+        total = 0
+        node = self.root
+        while node is not None:
+            if value >= node.value:
+                node = node.right
+            else:
+                total += _size(node.right) + node.count
+                node = node.left
+        return total
+
+    def _insert(self, node, value):
+        if node is None:
+            return _TreapNode(value)
+        if value == node.value:
+            node.count += 1
+        elif value < node.value:
+            node.left = self._insert(node.left, value)
+            if node.left.priority > node.priority:
+                node = self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, value)
+            if node.right.priority > node.priority:
+                node = self._rotate_left(node)
+        _update(node)
+        return node
+
+    def _remove(self, node, value):
+        if node is None:
+            raise KeyError(value)
+        if value < node.value:
+            node.left = self._remove(node.left, value)
+        elif value > node.value:
+            node.right = self._remove(node.right, value)
+        elif node.count > 1:
+            node.count -= 1
+        else:
+            # Rotate the node down until it has at most one child, then drop it
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            if node.left.priority > node.right.priority:
+                node = self._rotate_right(node)
+                node.right = self._remove(node.right, value)
+            else:
+                node = self._rotate_left(node)
+                node.left = self._remove(node.left, value)
+        _update(node)
+        return node
+
+    @staticmethod
+    def _rotate_right(node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        _update(node)
+        _update(pivot)
+        return pivot
+
+    @staticmethod
+    def _rotate_left(node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        _update(node)
+        _update(pivot)
+        return pivot
+
+
+class OnlineInversionCounter:
+    """Maintains the inversion count of a sequence under append and pop-left.
+
+    An appended value forms a new inversion with every earlier value larger
+    than it, and a value popped from the front takes away one inversion for
+    every remaining value smaller than it. Both counts come from an
+    order-statistic tree, so each operation costs O(log n) instead of a full
+    merge sort.
+    """
+
+    def __init__(self, values=(), window=None):
+        """Initializes the counter, optionally as a sliding window.
+
+        Args:
+            values (iterable): Initial values to append in order.
+            window (int): If set, the oldest value is dropped whenever the
+                sequence grows beyond this many values.
+
+        Raises:
+            ValueError: If the window size is not positive.
+        """
+        if window is not None and window <= 0:
+            raise ValueError("The window size must be positive.")
+        self.window = window
+        self.inversions = 0
+        self._values = deque()
+        self._tree = OrderStatisticTree()
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return len(self._values)
+
+    def append(self, value):
+        """Adds a value to the end of the sequence.
+
+        Args:
+            value (int or float): The value to add.
+
+        Returns:
+            int: The inversion count after the append (and any window eviction).
+
+        Raises:
+            TypeError: If the value is not a number.
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError("All elements of the array must be numbers.")
+        self.inversions += self._tree.count_greater(value)
+        self._tree.insert(value)
+        self._values.append(value)
+        if self.window is not None and len(self._values) > self.window:
+            self.popleft()
+        return self.inversions
+
+    def popleft(self):
+        """Removes the oldest value from the sequence.
+
+        Returns:
+            int: The inversion count after the removal.
+
+        Raises:
+            IndexError: If the sequence is empty.
+        """
+        if not self._values:
+            raise IndexError("pop from an empty sequence")
+        value = self._values.popleft()
+        self._tree.remove(value)
+        self.inversions -= self._tree.count_less(value)
+        return self.inversions
+
+
+if __name__ == "__main__":
+    stream = [23590, 23791, 23214, 23413, 23521, 23771, 23839, 23415, 23115, 23557]
+
+    counter = OnlineInversionCounter()
+    for value in stream:
+        print(f"Append {value} -> Number of inversions: {counter.append(value)}")
+
+    window = OnlineInversionCounter(window=4)
+    for value in stream:
+        print(f"Window of 4 after {value} -> Number of inversions: {window.append(value)}")
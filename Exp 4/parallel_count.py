@@ -0,0 +1,146 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from count_divide_conquer import merge_and_count, merge_sort_and_count
+from count_fenwick import validate_array
+
+# Below this many elements the process start-up cost outweighs any speedup
+SERIAL_CUTOFF = 100000
+# Largest integer magnitude a float64 buffer represents exactly
+EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def _shared_typecode(arr):
+    """Picks a fixed-width array typecode that holds every element exactly.
+
+    Returns:
+        str: "q" for int64, "d" for float64, or None if neither is exact.
+    """
+    if all(isinstance(x, int) for x in arr):
+        if all(-2 ** 63 <= x < 2 ** 63 for x in arr):
+            return "q"
+        return None
+    if all(isinstance(x, float) or abs(x) <= EXACT_FLOAT_LIMIT for x in arr):
+        return "d"
+    return None
+
+
+def _sort_chunk(shm_name, typecode, start, end):
+    """Sorts elements start..end-1 of the shared buffer in place and counts their inversions."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        chunk = view[start:end].tolist()
+        inv_count = merge_sort_and_count(chunk, [0] * len(chunk), 0, len(chunk) - 1)
+        view[start:end] = memoryview(array(typecode, chunk))
+        view.release()
+    finally:
+        shm.close()
+    return inv_count
+
+
+def _merge_runs(src_name, dst_name, typecode, low, mid, high):
+    """Merges the sorted runs low..mid-1 and mid..high-1 of one shared buffer into another.
+
+    Returns:
+        int: The number of inversions between the two runs.
+    """
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        src_view = src.buf.cast(typecode)
+        dst_view = dst.buf.cast(typecode)
+        runs = src_view[low:high].tolist()
+        inv_count = merge_and_count(runs, [0] * len(runs), 0, mid - low - 1, high - low - 1)
+        dst_view[low:high] = memoryview(array(typecode, runs))
+        src_view.release()
+        dst_view.release()
+    finally:
+        src.close()
+        dst.close()
+    return inv_count
+
+
+def parallel_count_inversions(arr, workers=None, serial_cutoff=SERIAL_CUTOFF):
+    """Counts inversions with merge sort spread over a process pool.
+
+    The array is copied once into a shared-memory buffer. Workers sort and
+    count contiguous chunks in place, then neighbouring sorted runs are merged
+    pairwise, round by round, into a second shared buffer while their
+    cross-run inversions are added. Only buffer names and bounds are sent to
+    the workers, and the result matches the serial count exactly.
+
+    Args:
+        arr (list): The list of numbers to check for inversions; it is not modified.
+        workers (int): The number of worker processes, defaults to the CPU count.
+        serial_cutoff (int): Arrays smaller than this are counted serially.
+
+    Returns:
+        int: The number of inversions in the array.
+
+    Raises:
+        ValueError: If the array is empty or has less than 10 elements.
+        TypeError: If any element in the array is not a number.
+    """
+    validate_array(arr)
+
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    typecode = _shared_typecode(arr)
+    if n < serial_cutoff or workers == 1 or typecode is None:
+        work_arr = list(arr)
+        return merge_sort_and_count(work_arr, [0] * n, 0, n - 1)
+
+    itemsize = array(typecode).itemsize
+    src = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    dst = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    try:
+        view = src.buf.cast(typecode)
+        view[:] = memoryview(array(typecode, arr))
+        view.release()
+
+        bounds = sorted({n * k // workers for k in range(workers + 1)})
+        runs = list(zip(bounds, bounds[1:]))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            inv_count = sum(pool.map(_sort_chunk, [src.name] * len(runs), [typecode] * len(runs),
+                                     [start for start, _ in runs], [end for _, end in runs]))
+
+            while len(runs) > 1:
+                futures = []
+                merged = []
+                for i in range(0, len(runs) - 1, 2):
+                    (low, mid), (_, high) = runs[i], runs[i + 1]
+                    futures.append(pool.submit(_merge_runs, src.name, dst.name, typecode,
+                                               low, mid, high))
+                    merged.append((low, high))
+                if len(runs) % 2:
+                    # The unpaired last run is carried over unchanged
+                    low, high = runs[-1]
+                    dst.buf[low * itemsize:high * itemsize] = src.buf[low * itemsize:high * itemsize]
+                    merged.append(runs[-1])
+                inv_count += sum(future.result() for future in futures)
+                runs = merged
+                src, dst = dst, src
+    finally:
+        for shm in (src, dst):
+            shm.close()
+            shm.unlink()
+    return inv_count
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from count_divide_conquer import count_inversions
+
+    data = [random.randrange(10 ** 9) for _ in range(400000)]
+    started = time.perf_counter()
+    serial = count_inversions(data)
+    print(f"Serial: {serial} inversions in {time.perf_counter() - started:.2f}s")
+    for worker_count in sorted({2, os.cpu_count() or 1}):
+        started = time.perf_counter()
+        result = parallel_count_inversions(data, workers=worker_count)
+        print(f"{worker_count} workers: {result} inversions in {time.perf_counter() - started:.2f}s")
@@ -0,0 +1,121 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from karatsuba import KARATSUBA_CUTOFF, _karatsuba
+
+# Number of recursion levels expanded into pool tasks (3, 9, 27 tasks)
+DEFAULT_DEPTH = 2
+# Below this many bits a product is computed serially
+PARALLEL_CUTOFF = 1 << 20
+
+
+def _to_bytes(n):
+    """Packs a non-negative integer into a compact little-endian byte buffer."""
+    return n.to_bytes((n.bit_length() + 7) // 8, "little")
+
+
+def _multiply_buffers(x_bytes, y_bytes, cutoff):
+    """Multiplies two byte-encoded non-negative integers in a worker process.
+
+    Returns:
+        bytes: The product, encoded the same way.
+    """
+    x = int.from_bytes(x_bytes, "little")
+    y = int.from_bytes(y_bytes, "little")
+    return _to_bytes(_karatsuba(x, y, cutoff))
+
+
+def _split(x, y, depth, cutoff, leaves):
+    """Expands the top Karatsuba levels into a tree of pending leaf products.
+
+    Args:
+        x (int): The first non-negative operand.
+        y (int): The second non-negative operand.
+        depth (int): The number of levels still to expand.
+        cutoff (int): Bit length below which a product is not split further.
+        leaves (list): Receives the (x, y) pairs to compute in the pool.
+
+    Returns:
+        tuple or int: A node (half_bits, z0, z1, z2) whose children are nodes
+            or indices into leaves.
+    """
+    x_bits, y_bits = x.bit_length(), y.bit_length()
+    if depth == 0 or x_bits < cutoff or y_bits < cutoff:
+        leaves.append((x, y))
+        return len(leaves) - 1
+
+    half_bits = max(x_bits, y_bits) // 2
+    mask = (1 << half_bits) - 1
+    x_high, x_low = x >> half_bits, x & mask
+    y_high, y_low = y >> half_bits, y & mask
+    return (half_bits,
+            _split(x_low, y_low, depth - 1, cutoff, leaves),
+            _split(x_low + x_high, y_low + y_high, depth - 1, cutoff, leaves),
+            _split(x_high, y_high, depth - 1, cutoff, leaves))
+
+
+def _combine(node, products):
+    """Recombines a tree from _split once its leaf products are known."""
+    if isinstance(node, int):
+        return products[node]
+    half_bits, low, cross, high = node
+    z0 = _combine(low, products)
+    z1 = _combine(cross, products)
+    z2 = _combine(high, products)
+    return (z2 << (2 * half_bits)) + ((z1 - z2 - z0) << half_bits) + z0
+
+
+def parallel_karatsuba(x, y, workers=None, depth=DEFAULT_DEPTH,
+                       parallel_cutoff=PARALLEL_CUTOFF, cutoff=KARATSUBA_CUTOFF):
+    """Karatsuba multiplication with the top recursion levels run in a process pool.
+
+    The first ``depth`` levels are split in the parent, producing up to
+    3 ** depth independent sub-products. These are sent to the workers as
+    little-endian byte buffers and computed with the serial Karatsuba, and
+    the results are recombined in the parent.
+
+    Args:
+        x (int): The first integer.
+        y (int): The second integer.
+        workers (int): The number of worker processes, defaults to the CPU count.
+        depth (int): The number of recursion levels dispatched to the pool.
+        parallel_cutoff (int): Operands with fewer bits are multiplied serially.
+        cutoff (int): Bit length below which the native multiply is used.
+
+    Returns:
+        int: The product of x and y.
+    """
+    negative = (x < 0) != (y < 0)
+    x, y = abs(x), abs(y)
+    cutoff = max(cutoff, 2)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or depth <= 0 or min(x.bit_length(), y.bit_length()) < parallel_cutoff:
+        product = _karatsuba(x, y, cutoff)
+    else:
+        leaves = []
+        tree = _split(x, y, depth, cutoff, leaves)
+        with ProcessPoolExecutor(max_workers=min(workers, len(leaves))) as pool:
+            results = pool.map(_multiply_buffers,
+                               [_to_bytes(a) for a, _ in leaves],
+                               [_to_bytes(b) for _, b in leaves],
+                               [cutoff] * len(leaves))
+            products = [int.from_bytes(result, "little") for result in results]
+        product = _combine(tree, products)
+    return -product if negative else product
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    a = random.getrandbits(1 << 22)
+    b = -random.getrandbits(1 << 22)
+    started = time.perf_counter()
+    serial = parallel_karatsuba(a, b, workers=1)
+    print(f"Serial: {time.perf_counter() - started:.2f}s")
+    for level in (1, 2, 3):
+        started = time.perf_counter()
+        result = parallel_karatsuba(a, b, depth=level)
+        print(f"Depth {level} ({3 ** level} tasks): {time.perf_counter() - started:.2f}s, "
+              f"correct = {result == serial == a * b}")
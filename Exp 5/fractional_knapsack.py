@@ -44,11 +44,12 @@ def fractional_knapsack(items, max_capacity=200):
     if any(item.weight == 0 for item in items):
         return "Error: One or more items have zero weight"
 
-    # Sort items by shelf life (ascending) and value-to-weight ratio (descending)
-    items.sort(key=lambda item: (item.shelf_life, -item.value_per_weight))
+    # Sort items by shelf life (ascending) and value-to-weight ratio (descending),
+    # leaving the caller's list in its original order
+    ordered_items = sorted(items, key=lambda item: (item.shelf_life, -item.value_per_weight))
 
     total_value = 0
-    for item in items:
+    for item in ordered_items:
         if max_capacity <= 0:
             break
         if item.weight <= max_capacity:
@@ -1,80 +1,355 @@
 import heapq
-from collections import defaultdict
-
-class Node:
-    """A node in the Huffman tree."""
-    
-    def __init__(self, char, freq):
-        """Initialize a node with a character and frequency."""
-        self.char = char
-        self.freq = freq
-        self.left = None
-        self.right = None
-
-    def __lt__(self, other):
-        """Less-than comparison for heapq."""
-        return self.freq < other.freq
-
-def build_huffman_tree(frequencies):
-    """Builds the Huffman tree and returns the root node."""
-    heap = [Node(char, freq) for char, freq in frequencies.items()]
+import struct
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pack_bits falls back to an integer accumulator
+    np = None
+
+# Characters packed per NumPy pass, bounding the temporary bit arrays
+PACK_CHUNK = 1 << 20
+# Longer code words are packed by the integer accumulator instead
+NUMPY_MAX_CODE_LENGTH = 32
+# Bits resolved per decoder table probe; the table has 2 ** LOOKUP_BITS entries
+LOOKUP_BITS = 12
+# Bytes appended to the decoder's bit window at a time
+REFILL_BYTES = 64
+
+# Container: magic, symbol count, character count, padding bits, then one
+# (codepoint, code length) entry per symbol and the packed code bits
+MAGIC = b'HUF1'
+HEADER = struct.Struct('<4sIQB')
+SYMBOL_ENTRY = struct.Struct('<IB')
+# Longest code the encoder emits, as in DEFLATE; raised only for alphabets
+# of more than 2 ** 15 characters
+MAX_CODE_LENGTH = 15
+
+def huffman_lengths(weights):
+    """Computes Huffman code lengths from the heap merge order.
+
+    Leaves are 0..n-1 and each merge creates the next internal node id, so
+    only a parent array is kept; since a parent is always created after its
+    children, one backward pass gives every depth without recursion.
+
+    Args:
+        weights (list[int]): The frequency of each symbol.
+
+    Returns:
+        list[int]: The code length of each symbol.
+    """
+    n = len(weights)
+    if n == 1:
+        return [1]
+    heap = [(weight, i) for i, weight in enumerate(weights)]
     heapq.heapify(heap)
+    parent = [0] * (2 * n - 1)
+    next_node = n
     while len(heap) > 1:
-        left = heapq.heappop(heap)
-        right = heapq.heappop(heap)
-        merged = Node(None, left.freq + right.freq)
-        merged.left = left
-        merged.right = right
-        heapq.heappush(heap, merged)
-    return heap[0]  # The root of the Huffman tree
-
-def generate_codes(node, prefix='', codebook=None):
-    """Generates Huffman codes for the characters in the tree."""
-    if codebook is None:
-        codebook = {}
-    if node is not None:
-        if node.char is not None:
-            codebook[node.char] = prefix
-        generate_codes(node.left, prefix + '0', codebook)
-        generate_codes(node.right, prefix + '1', codebook)
-    return codebook
+        left_weight, left = heapq.heappop(heap)
+        right_weight, right = heapq.heappop(heap)
+        parent[left] = parent[right] = next_node
+        heapq.heappush(heap, (left_weight + right_weight, next_node))
+        next_node += 1
+    depth = [0] * (2 * n - 1)
+    for node in range(2 * n - 3, -1, -1):
+        depth[node] = depth[parent[node]] + 1
+    return depth[:n]
+
+def package_merge_lengths(weights, max_length):
+    """Computes optimal code lengths no longer than max_length by package-merge.
+
+    Each round pairs adjacent items of the previous list into packages and
+    merges them with the leaves by weight; a symbol's code length is the
+    number of times it occurs in the first 2n - 2 items of the final list.
+
+    Args:
+        weights (list[int]): The frequency of each symbol.
+        max_length (int): The longest allowed code; 2 ** max_length must be
+            at least the number of symbols.
+
+    Returns:
+        list[int]: The code length of each symbol.
+    """
+    n = len(weights)
+    # An item is (weight, symbol, first, second); packages have symbol None
+    leaves = sorted((weight, i, None, None) for i, weight in enumerate(weights))
+    items = leaves
+    for _ in range(max_length - 1):
+        packages = [(items[k][0] + items[k + 1][0], None, items[k], items[k + 1])
+                    for k in range(0, len(items) - 1, 2)]
+        items = list(heapq.merge(leaves, packages, key=lambda item: item[0]))
+
+    lengths = [0] * n
+    stack = items[:2 * n - 2]
+    while stack:
+        _, symbol, first, second = stack.pop()
+        if symbol is None:
+            stack.append(first)
+            stack.append(second)
+        else:
+            lengths[symbol] += 1
+    return lengths
+
+def code_lengths(frequencies, max_length=MAX_CODE_LENGTH):
+    """Builds length-limited Huffman code lengths for a frequency table.
+
+    Plain Huffman lengths are used when they fit; otherwise package-merge
+    recomputes them under the limit. The limit is raised to the fewest bits
+    that can give every symbol a distinct code.
+
+    Args:
+        frequencies (dict): Maps each character to its count.
+        max_length (int): The longest allowed code.
+
+    Returns:
+        dict: Maps each character to its code length.
+    """
+    if not frequencies:
+        return {}
+    symbols = list(frequencies)
+    weights = [frequencies[char] for char in symbols]
+    lengths = huffman_lengths(weights)
+    max_length = max(max_length, (len(symbols) - 1).bit_length(), 1)
+    if max(lengths) > max_length:
+        lengths = package_merge_lengths(weights, max_length)
+    return dict(zip(symbols, lengths))
+
+def canonical_codes(lengths):
+    """Assigns canonical code words from code lengths alone.
+
+    Symbols are ordered by (length, codepoint) and given consecutive codes,
+    so a decoder can rebuild the same codebook from the lengths.
+
+    Returns:
+        dict: Maps each character to its (code word, length) pair.
+    """
+    words = {}
+    code = 0
+    previous_length = 0
+    for char in sorted(lengths, key=lambda c: (lengths[c], ord(c))):
+        code <<= lengths[char] - previous_length
+        previous_length = lengths[char]
+        words[char] = (code, previous_length)
+        code += 1
+    return words
+
+def pack_bits(data, words):
+    """Writes the code word of every character straight into a bytearray.
+
+    With NumPy each chunk of characters is mapped to its code words and
+    lengths, expanded to single bits and packed with packbits. Otherwise bits
+    are gathered in an integer accumulator and flushed eight bytes at a time.
+    Either way no '0'/'1' string is ever built. The last byte is padded with
+    zero bits at the low end.
+
+    Returns:
+        tuple: The packed bytes and the number of padding bits (0-7).
+    """
+    if not data or not words:
+        return bytearray(), 0
+    if np is not None and max(length for _, length in words.values()) <= NUMPY_MAX_CODE_LENGTH:
+        return _pack_bits_numpy(data, words)
+    packed = bytearray()
+    accumulator = 0
+    bit_count = 0
+    for char in data:
+        code, length = words[char]
+        accumulator = (accumulator << length) | code
+        bit_count += length
+        if bit_count >= 64:
+            bit_count -= 64
+            packed += (accumulator >> bit_count).to_bytes(8, 'big')
+            accumulator &= (1 << bit_count) - 1
+    padding = -bit_count % 8
+    packed += (accumulator << padding).to_bytes((bit_count + padding) // 8, 'big')
+    return packed, padding
+
+def _pack_bits_numpy(data, words):
+    """Vectorized pack_bits; the few bits left over after each chunk carry into the next."""
+    symbols = sorted(words)
+    codepoints = np.array([ord(char) for char in symbols])
+    lengths = np.array([words[char][1] for char in symbols])
+    width = int(lengths.max())
+    lookup = np.zeros(codepoints.max() + 1, dtype=np.int32)
+    lookup[codepoints] = np.arange(len(symbols))
+    # Row i holds the code word of symbol i as bits, most significant first,
+    # and the mask selects its first length bits
+    symbol_bits = np.array([[(code >> (length - 1 - j)) & 1 if j < length else 0 for j in range(width)]
+                            for code, length in (words[char] for char in symbols)], dtype=np.uint8)
+    symbol_mask = np.arange(width) < lengths[:, None]
+
+    packed = bytearray()
+    carry = np.zeros(0, dtype=np.uint8)
+    for start in range(0, len(data), PACK_CHUNK):
+        # surrogatepass keeps lone surrogates, which the accumulator path accepts too
+        text = data[start:start + PACK_CHUNK].encode('utf-32-le', 'surrogatepass')
+        chunk = np.frombuffer(text, dtype=np.uint32)
+        index = lookup[chunk]
+        bits = np.concatenate((carry, symbol_bits[index][symbol_mask[index]]))
+        whole = len(bits) - len(bits) % 8
+        packed += np.packbits(bits[:whole]).tobytes()
+        carry = bits[whole:]
+    padding = -len(carry) % 8
+    packed += np.packbits(carry).tobytes()
+    return packed, padding
 
 def huffman_encoding(data):
-    """Encodes the input string using Huffman coding."""
+    """Encodes the input string using Huffman coding.
+
+    Returns:
+        tuple: The bit-packed encoded data, the number of padding bits in
+            its last byte, and the codebook.
+    """
     if not isinstance(data, str):
         print("Input must be a string.")
-        return None, None
-    frequencies = defaultdict(int)
-    for char in data:
-        frequencies[char] += 1
-    huffman_tree = build_huffman_tree(frequencies)
-    huffman_codes = generate_codes(huffman_tree)
-    encoded_data = ''.join(huffman_codes[char] for char in data)
-    return encoded_data, huffman_codes
-
-def calculate_compression_ratio(original, encoded):
-    """Calculates the compression ratio."""
+        return None, None, None
+    words = canonical_codes(code_lengths(Counter(data)))
+    huffman_codes = {char: format(code, f'0{length}b') for char, (code, length) in words.items()}
+    encoded_data, padding = pack_bits(data, words)
+    return encoded_data, padding, huffman_codes
+
+def calculate_compression_ratio(original, encoded_bits):
+    """Calculates the compression ratio from the number of encoded bits."""
     original_size = len(original) * 8  # Assuming 8 bits per character
-    compressed_size = len(encoded)  # Length of the encoded string
+    compressed_size = encoded_bits
     print(original_size, compressed_size)
     if compressed_size == 0:
         print('Input file has no text')
         return None  # Handle division by zero
     return compressed_size / original_size
 
-def save_compressed_data(encoded_data, output_file):
-    """Saves the encoded data to a file, packing the bits into bytes."""
-    # Convert the string of bits into actual bytes
-    byte_data = bytearray()
-    for i in range(0, len(encoded_data), 8):
-        byte = encoded_data[i:i+8]
-        byte_data.append(int(byte, 2))  # Convert each 8 bits to a byte
-    
-    # Save the byte data to the file
+def pack_container(encoded_data, padding, huffman_codes, data_length):
+    """Prepends the self-describing header to the packed code bits.
+
+    Only the code lengths are stored; the decoder rebuilds the canonical
+    code words from them.
+    """
+    symbols = sorted(huffman_codes, key=ord)
+    header = bytearray(HEADER.pack(MAGIC, len(symbols), data_length, padding))
+    for char in symbols:
+        header += SYMBOL_ENTRY.pack(ord(char), len(huffman_codes[char]))
+    return bytes(header) + bytes(encoded_data)
+
+def unpack_container(container):
+    """Splits a container into its code lengths, character count and packed bits.
+
+    Raises:
+        ValueError: If the data does not start with a valid header.
+    """
+    if len(container) < HEADER.size:
+        raise ValueError("Truncated Huffman archive header.")
+    magic, symbol_count, data_length, padding = HEADER.unpack_from(container)
+    if magic != MAGIC or padding > 7:
+        raise ValueError("Not a Huffman archive.")
+    offset = HEADER.size + symbol_count * SYMBOL_ENTRY.size
+    if len(container) < offset:
+        raise ValueError("Truncated Huffman archive header.")
+    lengths = {chr(codepoint): length
+               for codepoint, length in SYMBOL_ENTRY.iter_unpack(container[HEADER.size:offset])}
+    return lengths, data_length, padding, memoryview(container)[offset:]
+
+def build_decode_table(words):
+    """Builds the multi-symbol lookup table used by huffman_decoding.
+
+    Entry i describes the LOOKUP_BITS-bit window i: the characters whose
+    complete codes it starts with, and how many bits they use. An entry
+    using 0 bits means the first code is longer than the window.
+    """
+    size = 1 << LOOKUP_BITS
+    single = [None] * size
+    for char, (code, length) in words.items():
+        if length <= LOOKUP_BITS:
+            start = code << (LOOKUP_BITS - length)
+            for entry in range(start, start + (1 << (LOOKUP_BITS - length))):
+                single[entry] = (char, length)
+
+    table = []
+    mask = size - 1
+    for window in range(size):
+        text = []
+        used = 0
+        while True:
+            match = single[(window << used) & mask]
+            if match is None or match[1] > LOOKUP_BITS - used:
+                break
+            text.append(match[0])
+            used += match[1]
+        table.append((''.join(text), used))
+    return table
+
+def huffman_decoding(encoded_data, padding, lengths, data_length):
+    """Decodes packed code bits given the canonical code lengths.
+
+    Each probe looks up LOOKUP_BITS bits at once and emits every complete
+    character they hold. Codes longer than the window fall back to a
+    canonical bit-by-bit decode.
+
+    Returns:
+        str: The decoded text.
+
+    Raises:
+        ValueError: If the bits run out before data_length characters.
+    """
+    if data_length == 0:
+        return ''
+    words = canonical_codes(lengths)
+    table = build_decode_table(words)
+    long_codes = {(code, length): char for char, (code, length) in words.items() if length > LOOKUP_BITS}
+    needed = max(LOOKUP_BITS, max(lengths.values()))
+
+    total_bits = len(encoded_data) * 8 - padding
+    mask = (1 << LOOKUP_BITS) - 1
+    pieces = []
+    produced = 0
+    consumed = 0
+    window = 0
+    window_bits = 0
+    position = 0
+    while produced < data_length:
+        while window_bits < needed:
+            if position > len(encoded_data) + needed // 8 + REFILL_BYTES:
+                raise ValueError("Huffman archive is truncated.")
+            # Past the end zero bits are shifted in; they are only ever peeked at
+            chunk = bytes(encoded_data[position:position + REFILL_BYTES]).ljust(REFILL_BYTES, b'\0')
+            position += REFILL_BYTES
+            window = ((window & ((1 << window_bits) - 1)) << (REFILL_BYTES * 8)) | int.from_bytes(chunk, 'big')
+            window_bits += REFILL_BYTES * 8
+        text, used = table[(window >> (window_bits - LOOKUP_BITS)) & mask]
+        if not used:
+            code = (window >> (window_bits - LOOKUP_BITS)) & mask
+            used = LOOKUP_BITS
+            while (code, used) not in long_codes:
+                if used == needed:
+                    raise ValueError("Invalid Huffman code in archive.")
+                used += 1
+                code = (code << 1) | ((window >> (window_bits - used)) & 1)
+            text = long_codes[(code, used)]
+        pieces.append(text)
+        produced += len(text)
+        consumed += used
+        window_bits -= used
+
+    # The last probe may decode a few characters beyond data_length
+    decoded = ''.join(pieces)
+    consumed -= sum(words[char][1] for char in decoded[data_length:])
+    if consumed > total_bits:
+        raise ValueError("Huffman archive is truncated.")
+    return decoded[:data_length]
+
+def save_compressed_data(encoded_data, padding, huffman_codes, data_length, output_file):
+    """Saves the packed data to a file with a header describing the codebook."""
     with open(output_file, 'wb') as file:
-        file.write(byte_data)
+        file.write(pack_container(encoded_data, padding, huffman_codes, data_length))
     print(f"Compressed data saved to {output_file}")
 
+def load_compressed_data(input_file):
+    """Reads a file written by save_compressed_data and returns the decoded text."""
+    with open(input_file, 'rb') as file:
+        container = file.read()
+    lengths, data_length, padding, encoded_data = unpack_container(container)
+    return huffman_decoding(encoded_data, padding, lengths, data_length)
+
 
 def run_huffman_test(file_path, output_file):
     """Runs Huffman encoding on the given file, saves the result to a new file, and prints results."""
@@ -84,8 +359,9 @@ def run_huffman_test(file_path, output_file):
             if len(data) == 0:
                 print("File is empty")
                 return
-            encoded_data, huffman_codes = huffman_encoding(data)
-            compression_ratio = calculate_compression_ratio(data, encoded_data)
+            encoded_data, padding, huffman_codes = huffman_encoding(data)
+            encoded_bits = len(encoded_data) * 8 - padding
+            compression_ratio = calculate_compression_ratio(data, encoded_bits)
             print(f"Test for file: {file_path}")
             # print("Encoded Data:", encoded_data)
             print("Huffman Codes:", huffman_codes)
@@ -93,7 +369,8 @@ def run_huffman_test(file_path, output_file):
             print("-" * 40)
             
             # Save the compressed data to the output file
-            save_compressed_data(encoded_data, output_file)
+            save_compressed_data(encoded_data, padding, huffman_codes, len(data), output_file)
+            print("Round Trip:", load_compressed_data(output_file) == data)
     except FileNotFoundError:
         print(f"File {file_path} not found.")
     except Exception as e:
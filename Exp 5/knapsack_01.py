@@ -0,0 +1,231 @@
+from fractional_knapsack import Item
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the fallback runs the DP in pure Python
+    np = None
+
+
+def validate_01_items(items, max_capacity):
+    """Applies the fractional_knapsack input checks plus the 0/1 requirements.
+
+    Args:
+        items (list[Item]): List of items to be considered.
+        max_capacity (int): Maximum weight capacity of the knapsack.
+
+    Returns:
+        str: An error message if inputs are invalid, otherwise None.
+    """
+    # Negative Test Case 1: No items available
+    if not items:
+        return "Error: No items available to load."
+
+    # Negative Test Case 2: All items have zero value
+    if all(item.value == 0 for item in items):
+        return "Error: All items have zero value."
+
+    # Negative Test Case 3: Item(s) with zero weight
+    if any(item.weight == 0 for item in items):
+        return "Error: One or more items have zero weight"
+
+    # Negative Test Case 4: The DP indexes capacity by whole weight units
+    if any(item.weight != int(item.weight) or item.weight < 0 for item in items):
+        return "Error: 0/1 knapsack requires non-negative integer weights."
+    if max_capacity != int(max_capacity):
+        return "Error: 0/1 knapsack requires an integer capacity."
+    return None
+
+
+def eligible_items(items, min_shelf_life=None):
+    """Selects the items that may be loaded, in shelf-life loading order.
+
+    Args:
+        items (list[Item]): List of items to be considered.
+        min_shelf_life (int): Items with a shorter shelf life are left out;
+            None keeps every item.
+
+    Returns:
+        list[Item]: The eligible items, ordered by shelf life (ascending) and
+            value-to-weight ratio (descending) as in fractional_knapsack.
+    """
+    if min_shelf_life is not None:
+        items = [item for item in items if item.shelf_life >= min_shelf_life]
+    return sorted(items, key=lambda item: (item.shelf_life, -item.value_per_weight))
+
+
+def reachable_weights(items, max_capacity):
+    """Finds every total weight some subset of the items adds up to exactly.
+
+    The reachable set is one big integer whose bit w is set when weight w is
+    reachable; adding an item is a single shift-and-or over all capacities.
+
+    Args:
+        items (list[Item]): Items with integer weights.
+        max_capacity (int): Weights above this are discarded.
+
+    Returns:
+        int: The bitset of reachable weights, bit 0 always set.
+    """
+    mask = (1 << (int(max_capacity) + 1)) - 1
+    bits = 1
+    for item in items:
+        bits = (bits | (bits << int(item.weight))) & mask
+    return bits
+
+
+def max_load(items, max_capacity=200):
+    """Calculates the heaviest total weight of whole items that fits.
+
+    Args:
+        items (list[Item]): List of items to be considered.
+        max_capacity (int): Maximum weight capacity of the knapsack.
+
+    Returns:
+        int or str: The largest loadable weight, or an error message if
+            inputs are invalid.
+    """
+    error = validate_01_items(items, max_capacity)
+    if error:
+        return error
+    if max_capacity <= 0:
+        return 0
+    return reachable_weights(items, max_capacity).bit_length() - 1
+
+
+def _best_values_numpy(items, capacity, reconstruct):
+    """Runs the DP with one vectorized maximum per item over the whole row.
+
+    The row is int64 when every value is an integer, so the result has the
+    same type as the pure-Python DP would give.
+
+    Returns:
+        tuple: The best value for every capacity and, if reconstruct is set,
+            one bit-packed row per item marking where the item was taken.
+    """
+    integral = all(isinstance(item.value, int) for item in items)
+    best = np.zeros(capacity + 1, dtype=np.int64 if integral else np.float64)
+    taken = []
+    for item in items:
+        weight = int(item.weight)
+        if weight > capacity:
+            if reconstruct:
+                taken.append(None)
+            continue
+        candidate = best[:-weight] + item.value
+        row = best[weight:]
+        if reconstruct:
+            better = candidate > row
+            taken.append(np.packbits(np.concatenate((np.zeros(weight, dtype=bool), better))))
+        np.maximum(row, candidate, out=row)
+    return best, taken
+
+
+def _best_values_python(items, capacity, reconstruct):
+    """Runs the same DP with a pure-Python loop over capacities.
+
+    Where each item was taken is kept as one big-int bitmask, bit c set when
+    the item improved capacity c, like the bitset in reachable_weights.
+    """
+    best = [0] * (capacity + 1)
+    taken = []
+    for item in items:
+        weight, value = int(item.weight), item.value
+        flags = bytearray((capacity >> 3) + 1) if reconstruct else None
+        for c in range(capacity, weight - 1, -1):
+            candidate = best[c - weight] + value
+            if candidate > best[c]:
+                best[c] = candidate
+                if reconstruct:
+                    flags[c >> 3] |= 1 << (c & 7)
+        if reconstruct:
+            taken.append(int.from_bytes(flags, "little"))
+    return best, taken
+
+
+def knapsack_01(items, max_capacity=200, min_shelf_life=None, reconstruct=False):
+    """Calculates the maximum value of whole items within the given weight capacity.
+
+    Unlike fractional_knapsack, an item is either loaded completely or not at
+    all. The classic DP over capacity is computed one item at a time; with
+    NumPy each item is a whole-row vectorized maximum, O(n * capacity) in
+    compiled code.
+
+    Args:
+        items (list[Item]): List of items to be considered.
+        max_capacity (int): Maximum weight capacity of the knapsack.
+        min_shelf_life (int): Items with a shorter shelf life are not loaded.
+        reconstruct (bool): Whether to also return the chosen items.
+
+    Returns:
+        int or float or tuple or str: Maximum total value achievable, with the
+            chosen items in shelf-life loading order if reconstruct is set,
+            or an error message if inputs are invalid.
+    """
+    error = validate_01_items(items, max_capacity)
+    if error:
+        return error
+
+    capacity = max(int(max_capacity), 0)
+    candidates = eligible_items(items, min_shelf_life)
+    if np is not None:
+        best, taken = _best_values_numpy(candidates, capacity, reconstruct)
+        total_value = best[capacity].item()
+    else:
+        best, taken = _best_values_python(candidates, capacity, reconstruct)
+        total_value = best[capacity]
+
+    if not reconstruct:
+        return total_value
+
+    # Walk the items backwards, following the capacity each choice came from
+    chosen = []
+    c = capacity
+    for item, row in zip(reversed(candidates), reversed(taken)):
+        if row is None:
+            continue
+        if np is not None:
+            took = (row[c >> 3] >> (7 - (c & 7))) & 1
+        else:
+            took = (row >> c) & 1
+        if took:
+            chosen.append(item)
+            c -= int(item.weight)
+    chosen.reverse()
+    return total_value, chosen
+
+
+def test_knapsack_01():
+    """Runs positive and negative test cases for the knapsack_01 function."""
+
+    # Positive Test Case 1: Items exactly fill the vehicle capacity with maximum value
+    items1 = [Item("A", 100, 500, 2), Item("B", 100, 700, 1)]
+    print(f"Test 1 Value: {knapsack_01(items1)}")
+
+    # Positive Test Case 2: The best whole-item load differs from the greedy fill
+    items2 = [Item("C", 150, 750, 1), Item("D", 70, 280, 2), Item("E", 50, 400, 3)]
+    print(f"Test 2: {knapsack_01(items2, reconstruct=True)}")
+
+    # Positive Test Case 3: Short shelf-life items are excluded
+    print(f"Test 3: {knapsack_01(items2, min_shelf_life=2, reconstruct=True)}")
+
+    # Positive Test Case 4: Heaviest feasible load from the reachable-weight bitset
+    print(f"Test 4 Load: {max_load(items2)}")
+
+    # Negative Test Case 1: All items have zero value
+    items4 = [Item("J", 50, 0, 1), Item("K", 100, 0, 2)]
+    print(f"Test 5: {knapsack_01(items4)}")
+
+    # Negative Test Case 2: No items to load
+    print(f"Test 6: {knapsack_01([])}")
+
+    # Negative Test Case 3: One item has zero weight (invalid case)
+    items6 = [Item("O", 0, 500, 1), Item("P", 100, 700, 2)]
+    print(f"Test 7: {knapsack_01(items6)}")
+
+    # Negative Test Case 4: Fractional weight (invalid case)
+    items7 = [Item("Q", 10.5, 500, 1)]
+    print(f"Test 8: {knapsack_01(items7)}")
+
+
+if __name__ == "__main__":
+    test_knapsack_01()
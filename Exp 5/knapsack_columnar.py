@@ -0,0 +1,198 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the fallback uses sorted() and bisect
+    np = None
+
+
+class ItemColumns:
+    """Item weights, values and shelf lives stored as typed columns.
+
+    Columns are NumPy arrays when NumPy is available and ``array('d')``
+    otherwise, so a catalog costs 24 bytes per item instead of one Item
+    object each.
+    """
+
+    def __init__(self, weights, values, shelf_lives):
+        """Initializes the columns.
+
+        Args:
+            weights (iterable of float): Weight of each item.
+            values (iterable of float): Value of each item.
+            shelf_lives (iterable of int): Shelf life of each item in days.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        if np is not None:
+            self.weights = np.asarray(weights, dtype=np.float64)
+            self.values = np.asarray(values, dtype=np.float64)
+            self.shelf_lives = np.asarray(shelf_lives, dtype=np.float64)
+        else:
+            self.weights = array("d", weights)
+            self.values = array("d", values)
+            self.shelf_lives = array("d", shelf_lives)
+        if not len(self.weights) == len(self.values) == len(self.shelf_lives):
+            raise ValueError("All item columns must have the same length.")
+
+    @classmethod
+    def from_items(cls, items):
+        """Builds columns from a list of Item objects.
+
+        Args:
+            items (list[Item]): The items to convert.
+
+        Returns:
+            ItemColumns: The columnar catalog.
+        """
+        return cls([item.weight for item in items], [item.value for item in items],
+                   [item.shelf_life for item in items])
+
+    def __len__(self):
+        return len(self.weights)
+
+    def validate(self):
+        """Applies the fractional_knapsack input checks to whole columns at once.
+
+        Returns:
+            str: An error message if the columns are invalid, otherwise None.
+        """
+        # Negative Test Case 1: No items available
+        if not len(self):
+            return "Error: No items available to load."
+
+        if np is not None:
+            all_zero_value = not self.values.any()
+            any_zero_weight = not self.weights.all()
+        else:
+            all_zero_value = not any(self.values)
+            any_zero_weight = not all(self.weights)
+
+        # Negative Test Case 2: All items have zero value
+        if all_zero_value:
+            return "Error: All items have zero value."
+
+        # Negative Test Case 3: Item(s) with zero weight
+        if any_zero_weight:
+            return "Error: One or more items have zero weight"
+        return None
+
+    def greedy_order(self, shelf_life_first=True):
+        """Orders the items by shelf life (ascending) and value-to-weight ratio (descending).
+
+        Args:
+            shelf_life_first (bool): Whether shelf life takes priority over the ratio.
+
+        Returns:
+            numpy.ndarray or list: Item indices in loading order; ties keep
+                input order, as in fractional_knapsack's stable sort.
+        """
+        if np is not None:
+            ratios = self.values / self.weights
+            keys = (-ratios, self.shelf_lives) if shelf_life_first else (-ratios,)
+            return np.lexsort(keys)
+        ratios = [value / weight for value, weight in zip(self.values, self.weights)]
+        if shelf_life_first:
+            return sorted(range(len(self)), key=lambda i: (self.shelf_lives[i], -ratios[i]))
+        return sorted(range(len(self)), key=lambda i: -ratios[i])
+
+    def prefix_sums(self, order):
+        """Computes running weight and value totals in the given loading order.
+
+        Args:
+            order (numpy.ndarray or list): Item indices in loading order.
+
+        Returns:
+            tuple: The cumulative weights and cumulative values.
+        """
+        if np is not None:
+            return np.cumsum(self.weights[order]), np.cumsum(self.values[order])
+        return (array("d", accumulate(self.weights[i] for i in order)),
+                array("d", accumulate(self.values[i] for i in order)))
+
+
+def fill_value(weights, values, cumulative_weights, cumulative_values, order, capacity):
+    """Evaluates the greedy fill for one capacity from prefix sums.
+
+    A binary search finds how many items fit whole; the next item in order
+    contributes one fractional term.
+
+    Args:
+        weights (sequence of float): Weight of each item.
+        values (sequence of float): Value of each item.
+        cumulative_weights (sequence of float): Running weight totals in loading order.
+        cumulative_values (sequence of float): Running value totals in loading order.
+        order (sequence of int): Item indices in loading order.
+        capacity (float): The knapsack capacity.
+
+    Returns:
+        float: The maximum total value for the capacity.
+    """
+    if capacity <= 0:
+        return 0
+    if np is not None:
+        full = int(np.searchsorted(cumulative_weights, capacity, side="right"))
+    else:
+        full = bisect_right(cumulative_weights, capacity)
+    total_value = cumulative_values[full - 1] if full else 0
+    if full < len(order):
+        used = cumulative_weights[full - 1] if full else 0
+        i = order[full]
+        total_value += values[i] / weights[i] * (capacity - used)
+    return float(total_value)
+
+
+def columnar_fractional_knapsack(columns, max_capacity=200, shelf_life_first=True):
+    """Calculates the maximum value obtainable from a columnar item catalog.
+
+    The loading order comes from a vectorized lexsort on (shelf_life, -ratio),
+    and the fill point from a cumulative sum plus a binary search, so there is
+    no per-item Python work when NumPy is available.
+
+    Args:
+        columns (ItemColumns or list[Item]): The items to be considered.
+        max_capacity (float): Maximum weight capacity of the knapsack.
+        shelf_life_first (bool): Whether shelf life takes priority over the ratio.
+
+    Returns:
+        float or str: Maximum total value achievable with given items, or an error message if inputs are invalid.
+    """
+    if not isinstance(columns, ItemColumns):
+        columns = ItemColumns.from_items(columns)
+    error = columns.validate()
+    if error:
+        return error
+
+    order = columns.greedy_order(shelf_life_first)
+    cumulative_weights, cumulative_values = columns.prefix_sums(order)
+    return fill_value(columns.weights, columns.values, cumulative_weights,
+                      cumulative_values, order, max_capacity)
+
+
+def test_columnar_fractional_knapsack():
+    """Runs the fractional_knapsack test cases against the columnar solver."""
+
+    # Positive Test Case 1: Items exactly fill the vehicle capacity with maximum value
+    print(f"Test 1 Value: {columnar_fractional_knapsack(ItemColumns([100, 100], [500, 700], [2, 1]))}")
+
+    # Positive Test Case 2: Items taken in fractional parts to maximize value
+    print(f"Test 2 Value: {columnar_fractional_knapsack(ItemColumns([150, 70, 50], [750, 280, 400], [1, 2, 3]))}")
+
+    # Positive Test Case 3: High-value item with low shelf life is partially included
+    print(f"Test 3 Value: {columnar_fractional_knapsack(ItemColumns([180, 50], [1200, 300], [1, 3]))}")
+
+    # Negative Test Case 1: All items have zero value
+    print(f"Test 4: {columnar_fractional_knapsack(ItemColumns([50, 100], [0, 0], [1, 2]))}")
+
+    # Negative Test Case 2: No items to load
+    print(f"Test 5: {columnar_fractional_knapsack(ItemColumns([], [], []))}")
+
+    # Negative Test Case 3: One item has zero weight (invalid case)
+    print(f"Test 6: {columnar_fractional_knapsack(ItemColumns([0, 100], [500, 700], [1, 2]))}")
+
+
+if __name__ == "__main__":
+    test_columnar_fractional_knapsack()
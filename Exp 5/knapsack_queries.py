@@ -0,0 +1,96 @@
+from knapsack_columnar import ItemColumns, fill_value, np
+
+
+class PreparedKnapsack:
+    """Answers many fractional knapsack capacities against one item set.
+
+    The items are validated and put in greedy order once, and running weight
+    and value totals are stored in that order. Each capacity is then a binary
+    search over the weight totals plus one fractional term, O(log n) instead
+    of a full re-sort per query.
+    """
+
+    def __init__(self, items, shelf_life_first=True):
+        """Validates, orders and indexes the items.
+
+        Args:
+            items (ItemColumns or list[Item]): The items to be considered.
+            shelf_life_first (bool): Whether shelf life takes priority over the ratio.
+        """
+        if not isinstance(items, ItemColumns):
+            items = ItemColumns.from_items(items)
+        self.columns = items
+        self.error = items.validate()
+        if self.error:
+            return
+        self.order = items.greedy_order(shelf_life_first)
+        self.cumulative_weights, self.cumulative_values = items.prefix_sums(self.order)
+
+    def query(self, capacity):
+        """Calculates the maximum value obtainable for one capacity.
+
+        Args:
+            capacity (float): The knapsack capacity.
+
+        Returns:
+            float or str: Maximum total value achievable, or the error message
+                if the items are invalid.
+        """
+        if self.error:
+            return self.error
+        return fill_value(self.columns.weights, self.columns.values, self.cumulative_weights,
+                          self.cumulative_values, self.order, capacity)
+
+    def query_many(self, capacities):
+        """Calculates the maximum value obtainable for a batch of capacities.
+
+        With NumPy the whole batch is answered by one vectorized searchsorted.
+
+        Args:
+            capacities (iterable of float): The knapsack capacities.
+
+        Returns:
+            list: The maximum total value for each capacity, or the error
+                message if the items are invalid.
+        """
+        if self.error:
+            return self.error
+        if np is None:
+            return [self.query(capacity) for capacity in capacities]
+
+        capacities = np.asarray(capacities, dtype=np.float64)
+        weights, values = self.columns.weights, self.columns.values
+        n = len(self.order)
+
+        full = np.searchsorted(self.cumulative_weights, capacities, side="right")
+        before = np.maximum(full - 1, 0)
+        used = np.where(full > 0, self.cumulative_weights[before], 0.0)
+        totals = np.where(full > 0, self.cumulative_values[before], 0.0)
+
+        # One fractional term from the next item in order, if any remains
+        partial = full < n
+        next_item = self.order[np.minimum(full, n - 1)]
+        ratios = values[next_item] / weights[next_item]
+        totals = totals + np.where(partial, ratios * (capacities - used), 0.0)
+        totals = np.where(capacities > 0, totals, 0.0)
+        return totals.tolist()
+
+
+def test_prepared_knapsack():
+    """Runs several capacities against one prepared item set."""
+    from fractional_knapsack import Item
+
+    items = [Item("C", 150, 750, 1), Item("D", 70, 280, 2), Item("E", 50, 400, 3)]
+    solver = PreparedKnapsack(items)
+    capacities = [0, 100, 150, 200, 220, 270, 500]
+    for capacity, value in zip(capacities, solver.query_many(capacities)):
+        print(f"Capacity {capacity}: {value}")
+    print(f"Single query for 200: {solver.query(200)}")
+
+    # Negative Test Case: One item has zero weight (invalid case)
+    invalid = PreparedKnapsack([Item("O", 0, 500, 1), Item("P", 100, 700, 2)])
+    print(f"Invalid items: {invalid.query_many(capacities)}")
+
+
+if __name__ == "__main__":
+    test_prepared_knapsack()
@@ -0,0 +1,124 @@
+import random
+
+from fractional_knapsack import Item
+
+
+def priority_key(item, index, shelf_life_first=True):
+    """Builds the greedy order key of an item.
+
+    The original index breaks ties, so the order matches the stable sort in
+    fractional_knapsack and every key is distinct.
+
+    Args:
+        item (Item): The item to rank.
+        index (int): The position of the item in the input list.
+        shelf_life_first (bool): Whether shorter shelf life takes priority
+            over a higher value-to-weight ratio.
+
+    Returns:
+        tuple: The key; smaller keys are loaded first.
+    """
+    if shelf_life_first:
+        return item.shelf_life, -item.value_per_weight, index
+    return -item.value_per_weight, index
+
+
+def fractional_knapsack_select(items, max_capacity=200, shelf_life_first=True):
+    """Solves the fractional knapsack without sorting, in expected linear time.
+
+    Instead of sorting every item, the critical item (the one that is only
+    partly loaded) is found by weighted-median partitioning: a random pivot
+    splits the candidates into higher- and lower-priority items; if the
+    higher-priority side already exceeds the capacity only that side is
+    searched further, otherwise it is loaded whole and the search continues
+    on the lower-priority side. Each round discards a constant fraction of
+    the candidates on average. The caller's list is not modified.
+
+    Args:
+        items (list[Item]): List of items to be considered.
+        max_capacity (float): Maximum weight capacity of the knapsack.
+        shelf_life_first (bool): Whether to load by shelf life first, as
+            fractional_knapsack does, or by value-to-weight ratio alone.
+
+    Returns:
+        tuple or str: The maximum total value and a list of (item, fraction)
+            pairs for the loaded items in input order, or an error message
+            if inputs are invalid.
+    """
+    # Negative Test Case 1: No items available
+    if not items:
+        return "Error: No items available to load."
+
+    # Negative Test Case 2: All items have zero value
+    if all(item.value == 0 for item in items):
+        return "Error: All items have zero value."
+
+    # Negative Test Case 3: Item(s) with zero weight
+    if any(item.weight == 0 for item in items):
+        return "Error: One or more items have zero weight"
+
+    fractions = [0] * len(items)
+    candidates = [(priority_key(item, i, shelf_life_first), i) for i, item in enumerate(items)]
+    capacity = max_capacity
+
+    while candidates and capacity > 0:
+        pivot_key, pivot = random.choice(candidates)
+        higher = [c for c in candidates if c[0] < pivot_key]
+        higher_weight = sum(items[i].weight for _, i in higher)
+
+        if higher_weight >= capacity:
+            # The critical item is among the higher-priority candidates
+            candidates = higher
+            continue
+
+        # Every higher-priority candidate fits completely
+        for _, i in higher:
+            fractions[i] = 1
+        capacity -= higher_weight
+
+        pivot_weight = items[pivot].weight
+        if pivot_weight > capacity:
+            fractions[pivot] = capacity / pivot_weight
+            capacity = 0
+        else:
+            fractions[pivot] = 1
+            capacity -= pivot_weight
+            candidates = [c for c in candidates if c[0] > pivot_key]
+
+    chosen = [(item, fraction) for item, fraction in zip(items, fractions) if fraction]
+    total_value = sum(item.value * fraction for item, fraction in chosen)
+    return total_value, chosen
+
+
+def test_fractional_knapsack_select():
+    """Runs the fractional_knapsack test cases through the selection-based solver."""
+
+    # Positive Test Case 1: Items exactly fill the vehicle capacity with maximum value
+    items1 = [Item("A", 100, 500, 2), Item("B", 100, 700, 1)]
+    print(f"Test 1: {fractional_knapsack_select(items1)}")
+
+    # Positive Test Case 2: Items taken in fractional parts to maximize value
+    items2 = [Item("C", 150, 750, 1), Item("D", 70, 280, 2), Item("E", 50, 400, 3)]
+    print(f"Test 2: {fractional_knapsack_select(items2)}")
+
+    # Positive Test Case 3: High-value item with low shelf life is partially included
+    items3 = [Item("F", 180, 1200, 1), Item("G", 50, 300, 3)]
+    print(f"Test 3: {fractional_knapsack_select(items3)}")
+
+    # Positive Test Case 4: Ratio-only priority ignores shelf life
+    print(f"Test 4: {fractional_knapsack_select(items2, shelf_life_first=False)}")
+
+    # Negative Test Case 1: All items have zero value
+    items4 = [Item("J", 50, 0, 1), Item("K", 100, 0, 2)]
+    print(f"Test 5: {fractional_knapsack_select(items4)}")
+
+    # Negative Test Case 2: No items to load
+    print(f"Test 6: {fractional_knapsack_select([])}")
+
+    # Negative Test Case 3: One item has zero weight (invalid case)
+    items6 = [Item("O", 0, 500, 1), Item("P", 100, 700, 2)]
+    print(f"Test 7: {fractional_knapsack_select(items6)}")
+
+
+if __name__ == "__main__":
+    test_fractional_knapsack_select()